@@ -63,6 +63,7 @@ const useModalClose = (isOpen, onClose) => {
     }, [isOpen, onClose]);
 
     return {
+        'data-testid': 'modal-backdrop',
         onClick: (e) => {
             if (e.target === e.currentTarget) onClose();
         }
@@ -943,7 +944,7 @@ const Header = ({ balance, portfolioValue, isRunning, setIsRunning, onSaveSessio
     return (
     <header className="mb-6 flex flex-col md:flex-row justify-between items-center gap-4 bg-white dark:bg-slate-800 p-4 rounded-xl shadow-sm border border-slate-200 dark:border-slate-700 transition-colors duration-200">
         <div>
-            <h1 className="text-2xl font-bold text-slate-900 dark:text-white flex items-center gap-2"><TrendingUp className="text-blue-600" /> Kalshi ArbBot <span className="text-xs font-mono text-slate-400">v1.1.1 (2026-01-24)</span></h1>
+            <h1 className="text-2xl font-bold text-slate-900 dark:text-white flex items-center gap-2"><TrendingUp className="text-blue-600" /> Kalshi ArbBot <span className="text-xs font-mono text-slate-400">v1.1.3 (2026-10-15)</span></h1>
             <div className="flex items-center gap-2 mt-1">
                 <span
                     className={`text-[10px] font-bold px-2 py-0.5 rounded border flex items-center gap-1 cursor-help ${
@@ -2036,7 +2037,7 @@ const MarketRow = React.memo(({ market, onExecute, marginPercent, tradeSize, isS
 
     return (
         <>
-            <tr key={market.id} onClick={() => setExpanded(!expanded)} className={`hover:bg-slate-50 dark:hover:bg-slate-700 transition-colors cursor-pointer border-b border-slate-100 dark:border-slate-700 ${!isSelected ? 'opacity-60 bg-slate-50 dark:bg-slate-700/50' : ''}`}>
+            <tr key={market.id} data-testid={`market-row-${market.id}`} onClick={() => setExpanded(!expanded)} className={`hover:bg-slate-50 dark:hover:bg-slate-700 transition-colors cursor-pointer border-b border-slate-100 dark:border-slate-700 ${!isSelected ? 'opacity-60 bg-slate-50 dark:bg-slate-700/50' : ''}`}>
                 <td className="px-4 py-3 text-center" onClick={(e) => e.stopPropagation()}>
                      <input
                         type="checkbox"
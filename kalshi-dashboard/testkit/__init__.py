@@ -0,0 +1 @@
+"""Helpers shared by the pytest suite (tests/) and the Playwright verification scripts (verification/)."""
@@ -0,0 +1,40 @@
+"""Chromium launch flags, plus one long-running Chromium that standalone verification scripts can share.
+
+    python -m testkit.browser                                      # from kalshi-dashboard/; leave running
+    CDP_URL=http://localhost:9222 python verification/verify_dashboard.py
+
+Scripts attach over CDP when CDP_URL is set and launch their own browser otherwise.
+(Under pytest they share pytest-playwright's session browser instead; see verification/conftest.py.)
+"""
+import os
+from playwright.sync_api import sync_playwright
+
+CDP_PORT = 9222
+
+# Nothing draws to canvas, and /dev/shm is small in containers and under parallel workers.
+# Playwright already disables sync, background networking, translate, audio and first-run.
+CHROMIUM_ARGS = ["--disable-gpu", "--disable-dev-shm-usage"]
+
+# Marks the session as past PasswordAuth (src/components/PasswordAuth.jsx)
+PASSWORD_GATE_SCRIPT = "sessionStorage.setItem('authenticated', 'true');"
+
+def launch_browser(playwright, args=(), **launch_kwargs):
+    """Attaches to the shared browser at $CDP_URL if set, otherwise launches a headless Chromium.
+
+    Extra args are added to CHROMIUM_ARGS. Closing an attached browser only disconnects and
+    drops the contexts this script created.
+    """
+    cdp_url = os.environ.get("CDP_URL")
+    if cdp_url:
+        return playwright.chromium.connect_over_cdp(cdp_url)
+    return playwright.chromium.launch(headless=True, args=[*CHROMIUM_ARGS, *args], **launch_kwargs)
+
+if __name__ == "__main__":
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=[*CHROMIUM_ARGS, f"--remote-debugging-port={CDP_PORT}"])
+        print(f"CDP_URL=http://localhost:{CDP_PORT}", flush=True)
+        try:
+            input("Chromium is running; press Enter to stop.\n")
+        except (KeyboardInterrupt, EOFError):
+            pass
+        browser.close()
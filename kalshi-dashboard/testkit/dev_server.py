@@ -0,0 +1,88 @@
+"""Starts (or reuses) and warms up the Vite dev server."""
+import contextlib
+import http.client
+import logging
+import os
+import ssl
+import subprocess
+import time
+import urllib.request
+
+# kalshi-dashboard/, where node_modules lives; scripts may be launched from the repo root
+DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def server_is_ready(url):
+    """Returns True if the dev server answers at url."""
+    # The dev server uses a self-signed certificate (vite-plugin-basic-ssl)
+    try:
+        urllib.request.urlopen(url, timeout=1, context=ssl._create_unverified_context())
+        return True
+    except OSError:
+        return False
+
+def wait_until_ready(url, timeout=15.0, interval=0.1):
+    """Polls url until the dev server answers. Returns True if it came up in time."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server_is_ready(url):
+            return True
+        time.sleep(interval)
+    return False
+
+# Vite transforms modules on first request; these cover the entry point and the bulk of the app
+WARMUP_PATHS = ["/", "/src/main.jsx", "/src/App.jsx"]
+
+def warm_up(port, host="localhost"):
+    """Requests the entry modules once, browserless, so the first page load doesn't pay Vite's cold compile.
+
+    A failure is only logged: the first page load then compiles on demand.
+    """
+    # One keep-alive connection for all paths: a single TLS handshake against the self-signed cert
+    conn = http.client.HTTPSConnection(host, port, timeout=30, context=ssl._create_unverified_context())
+    start = time.monotonic()
+    try:
+        for path in WARMUP_PATHS:
+            conn.request("GET", path)
+            conn.getresponse().read()
+        logging.info("Warmed dev server on port %d in %.1fs.", port, time.monotonic() - start)
+    except (OSError, http.client.HTTPException) as e:
+        logging.warning(f"Dev server warm-up failed ({e}); the first page load will compile on demand.")
+    finally:
+        conn.close()
+
+@contextlib.contextmanager
+def dev_server(port=3000, env=None):
+    """Yields the dev server URL, starting Vite only if nothing is already serving it.
+
+    A server started here gets env, is warmed up before use and is terminated on exit. One that
+    was already running is assumed warm and left alone, and keeps whatever environment it was
+    started with. Concurrent callers (e.g. pytest-xdist workers) should each use their own port.
+    """
+    url = f"https://localhost:{port}"
+    if server_is_ready(url):
+        logging.info(f"Reusing dev server on {url}")
+        if env:
+            logging.warning(f"The dev server on {url} was started elsewhere; {', '.join(env)} not applied.")
+        yield url
+        return
+
+    logging.info(f"Starting dev server on {url}...")
+    process = subprocess.Popen(
+        ["node", "./node_modules/vite/bin/vite.js", "--port", str(port), "--strictPort"],
+        cwd=DASHBOARD_DIR,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        if wait_until_ready(url):
+            warm_up(port)
+        else:
+            logging.warning(f"Dev server did not answer on {url} within 15s; continuing anyway.")
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
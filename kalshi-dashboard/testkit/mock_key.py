@@ -0,0 +1,26 @@
+"""Throwaway RSA key for mocked credentials."""
+import os
+import tempfile
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# RSA keygen takes up to a few hundred ms, so the key is generated once and reused (gitignored)
+MOCK_KEY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "mock_key.pem")
+
+def mock_key_pem():
+    """Returns the cached mock private key as PEM text, generating it on first use."""
+    if not os.path.exists(MOCK_KEY_PATH):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        # Write then rename, so a parallel worker never reads a half-written file
+        os.makedirs(os.path.dirname(MOCK_KEY_PATH), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(MOCK_KEY_PATH))
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+        os.replace(tmp_path, MOCK_KEY_PATH)
+    with open(MOCK_KEY_PATH, "r") as f:
+        return f.read()
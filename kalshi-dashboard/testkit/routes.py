@@ -0,0 +1,33 @@
+"""Route matching and dispatch for the mocked Kalshi proxy and The-Odds-API.
+
+Callers serialize their response bodies once, at import, and serve them with fulfill_json;
+route handlers fire on every poll.
+"""
+import re
+
+JSON = "application/json"
+
+# Kalshi endpoints served by the mocks; the query string is optional, sub-paths are not matched
+KALSHI_ROUTE_RE = re.compile(r"/api/kalshi/(portfolio/balance|markets|portfolio/orders|portfolio/positions)(?:\?.*)?$")
+KALSHI_ENDPOINTS = {
+    "portfolio/balance": "balance",
+    "markets": "markets",
+    "portfolio/orders": "orders",
+    "portfolio/positions": "positions",
+}
+ODDS_API_RE = re.compile(r"^https://api\.the-odds-api\.com/")
+
+def fulfill_json(route, body, status=200):
+    route.fulfill(status=status, content_type=JSON, body=body)
+
+def route_kalshi(target, handlers):
+    """Registers one route on a Page or BrowserContext for every mocked Kalshi endpoint.
+
+    handlers maps an endpoint name ("balance", "markets", "orders", "positions") to its route
+    handler. It is looked up per request, so a caller can swap a handler by assigning into it.
+    """
+    def handle_kalshi(route):
+        endpoint = KALSHI_ROUTE_RE.search(route.request.url).group(1)
+        handlers[KALSHI_ENDPOINTS[endpoint]](route)
+
+    target.route(KALSHI_ROUTE_RE, handle_kalshi)
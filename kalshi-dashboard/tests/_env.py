@@ -0,0 +1,7 @@
+"""LIVE-mode flags, read from the environment; imported by conftest.py and test modules at import time."""
+import os
+
+# Determine if running in LIVE mode
+# We also enable live mode if the keys are present in the environment
+HAS_KEYS = "KALSHI_DEMO_API_KEY" in os.environ and "KALSHI_DEMO_API_KEY_ID" in os.environ
+TEST_LIVE = os.environ.get("TEST_LIVE") == "1" or HAS_KEYS
@@ -1,59 +1,153 @@
 import pytest
+import http.client
+import inspect
+import json
 import os
+import signal
+import socket
+import ssl
 import subprocess
 import time
-from playwright.sync_api import sync_playwright
 import logging
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from .mock_data import MOCK_BALANCE, MOCK_MARKETS, MOCK_ORDERS, MOCK_POSITIONS, MOCK_HISTORY, MOCK_ORDER_RESPONSE
-
-logging.basicConfig(level=logging.INFO)
-
-# Determine if running in LIVE mode
-# We also enable live mode if the keys are present in the environment
-HAS_KEYS = "KALSHI_DEMO_API_KEY" in os.environ and "KALSHI_DEMO_API_KEY_ID" in os.environ
-TEST_LIVE = os.environ.get("TEST_LIVE") == "1" or HAS_KEYS
-
-def generate_mock_key():
-    """Generates a temporary RSA private key for testing."""
-    key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-    )
-    pem = key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
+from testkit.browser import CHROMIUM_ARGS, PASSWORD_GATE_SCRIPT
+from testkit.dev_server import warm_up
+from testkit.mock_key import mock_key_pem
+from ._env import TEST_LIVE
+from .mock_data import MOCK_TRADE_HISTORY
+from .mocks import install_default_mocks
+from .network_cache import install_network_cache
+
+# Each pytest-xdist worker (gw0, gw1, ...) gets its own Vite server on 3000 + worker index
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+VITE_PORT = 3000 + int(WORKER_ID[2:])
+VITE_URL = f"https://localhost:{VITE_PORT}"
+# PID of the Vite server this suite started, so a later session can stop exactly that process
+VITE_PIDFILE = f".vite-{VITE_PORT}.pid"
+
+# Zero-length animations/transitions, so elements are stable (and actionable) immediately
+NO_ANIMATIONS_SCRIPT = """
+    (() => {
+        const style = document.createElement('style');
+        style.textContent = '*, *::before, *::after { animation-duration: 0s !important; animation-delay: 0s !important; '
+            + 'transition-duration: 0s !important; transition-delay: 0s !important; scroll-behavior: auto !important; }';
+        const inject = () => (document.head || document.documentElement).appendChild(style);
+        if (document.documentElement) inject(); else document.addEventListener('DOMContentLoaded', inject);
+    })();
+"""
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--screenshots", action="store_true", default=False,
+        help="Save debug screenshots (JPEG) to test-results/ where tests request them.",
     )
-    return pem.decode('utf-8')
+
+def pytest_collection_modifyitems(config, items):
+    """In LIVE mode, deselects tests that take mock_api directly; they assert on mock data."""
+    if not TEST_LIVE:
+        return
+    selected, deselected = [], []
+    for item in items:
+        params = inspect.signature(item.function).parameters
+        (deselected if "mock_api" in params else selected).append(item)
+    if deselected:
+        logging.info("LIVE MODE: Deselecting %d mock-only tests.", len(deselected))
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+def port_is_open(host, port):
+    """Returns True if something accepts TCP connections on host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+def wait_for_port(host, port, timeout=15.0, interval=0.1, is_open=True):
+    """Polls until host:port is open (or, with is_open=False, closed). Returns True if it did so in time."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if port_is_open(host, port) == is_open:
+            return True
+        time.sleep(interval)
+    return False
+
+def is_vite_process(pid):
+    """Returns True if pid is a running Vite process (PIDs get reused once a process exits)."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return b"vite" in f.read()
+    except OSError:
+        return False
+
+def stop_previous_vite():
+    """Stops the Vite server a previous session started, per its pidfile; other processes are never touched.
+
+    The pidfile is removed either way. A PID that no longer belongs to a Vite process is stale
+    (and may have been reused by something unrelated), so it is never signalled.
+    """
+    try:
+        with open(VITE_PIDFILE) as f:
+            pid = int(f.read())
+    except (OSError, ValueError):
+        return
+    if is_vite_process(pid):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+    os.remove(VITE_PIDFILE)
+
+def vite_is_running(host="127.0.0.1", port=VITE_PORT):
+    """Returns True if a dev server is already answering on host:port."""
+    # The dev server uses a self-signed certificate (vite-plugin-basic-ssl)
+    conn = http.client.HTTPSConnection(host, port, timeout=1, context=ssl._create_unverified_context())
+    try:
+        conn.request("HEAD", "/")
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
 
 # Fixture to start Vite server
 @pytest.fixture(scope="session", autouse=True)
 def vite_server():
-    # Kill any existing on port 3000 (best effort)
-    try:
-        subprocess.run(["pkill", "-f", "vite"], check=False)
-    except FileNotFoundError:
-        pass
+    # Reuse a dev server that is already running (e.g. `npm run dev`) unless a restart is forced
+    if os.environ.get("KALSHI_FORCE_VITE_RESTART") != "1" and vite_is_running():
+        logging.info(f"Reusing Vite server already running on port {VITE_PORT}.")
+        yield None
+        return
 
-    logging.info("Starting Vite server...")
+    # Stop a server we started earlier; fail fast if anything else holds this worker's port
+    stop_previous_vite()
+    if not wait_for_port("127.0.0.1", VITE_PORT, timeout=5, is_open=False):
+        pytest.exit(f"Port {VITE_PORT} is in use by another process; stop it before running the suite.", returncode=1)
+
+    logging.info(f"Starting Vite server on port {VITE_PORT}...")
     env = os.environ.copy()
     # Set to demo API
     env["KALSHI_API_URL"] = "https://demo-api.kalshi.co"
 
     # Start Vite server
     # We assume the user runs pytest from the 'kalshi-dashboard' directory.
+    # --strictPort makes Vite fail instead of silently moving to another port.
+    # Output is discarded (never piped, so Vite can't block on a full buffer); set
+    # KALSHI_VITE_LOG=<path> to keep it in a file for debugging.
+    log_path = os.environ.get("KALSHI_VITE_LOG")
+    log_file = open(log_path, "wb") if log_path else subprocess.DEVNULL
     process = subprocess.Popen(
-        ["node", "./node_modules/vite/bin/vite.js", "--port", "3000", "--host", "0.0.0.0"],
+        ["node", "./node_modules/vite/bin/vite.js", "--port", str(VITE_PORT), "--strictPort", "--host", "0.0.0.0"],
         cwd=".",
         env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+        stdout=log_file,
+        stderr=subprocess.STDOUT
     )
+    with open(VITE_PIDFILE, "w") as f:
+        f.write(str(process.pid))
 
     # Wait for server to start
-    time.sleep(10)
+    if not wait_for_port("127.0.0.1", VITE_PORT):
+        logging.warning(f"Vite did not open port {VITE_PORT} within 15s; continuing anyway.")
 
     yield process
 
@@ -62,13 +156,48 @@ def vite_server():
         process.wait(timeout=5)
     except subprocess.TimeoutExpired:
         process.kill()
+    if os.path.exists(VITE_PIDFILE):
+        os.remove(VITE_PIDFILE)
+    if log_path:
+        log_file.close()
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_vite_server(vite_server):
+    """Requests the entry modules once, browserless, so the first test doesn't pay Vite's cold compile."""
+    warm_up(VITE_PORT, host="127.0.0.1")
+
+@pytest.fixture(scope="session")
+def vite_url():
+    """Base URL of the dev server owned by this worker."""
+    return VITE_URL
+
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """Launches Chromium once per session; tests get their own lightweight context."""
+    # Fail once, up front, rather than erroring in every test when the binaries are missing
+    executable = playwright.chromium.executable_path
+    if not os.path.exists(executable):
+        pytest.exit(f"Chromium not found at {executable}; run `playwright install chromium`.", returncode=1)
+    browser = playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    yield browser
+    browser.close()
 
 @pytest.fixture(scope="function")
-def context(playwright):
-    browser = playwright.chromium.launch(headless=True)
-    context = browser.new_context(ignore_https_errors=True)
+def context(browser, request):
+    # A fresh context per test isolates cookies and storage without relaunching the browser.
+    # Storage state can only be set at creation, so the seeded marker (not a downstream fixture) opts in.
+    if request.node.get_closest_marker("seeded"):
+        context = browser.new_context(
+            ignore_https_errors=True, storage_state=request.getfixturevalue("auth_storage_state")
+        )
+        context.add_init_script(script=request.getfixturevalue("auth_init_script"))
+    else:
+        context = browser.new_context(ignore_https_errors=True)
+    # Every test starts past the password gate; it is not what these tests exercise
+    context.add_init_script(script=PASSWORD_GATE_SCRIPT)
+    context.add_init_script(script=NO_ANIMATIONS_SCRIPT)
     yield context
-    browser.close()
+    context.close()
 
 @pytest.fixture(scope="function")
 def page(context):
@@ -77,46 +206,73 @@ def page(context):
     page.close()
 
 @pytest.fixture(scope="function")
-def mock_api(page):
-    """Mocks Kalshi API responses if enabled (NOT LIVE)."""
-    if TEST_LIVE:
-        logging.info("LIVE MODE: Skipping network mocks.")
-        return
+def debug_screenshot(page, request):
+    """Returns capture(name); saves a screenshot only when pytest runs with --screenshots.
 
-    # Mock Balance
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json=MOCK_BALANCE))
+    JPEG at quality 60 encodes much faster than PNG and is plenty for eyeballing a failure.
+    """
+    enabled = request.config.getoption("--screenshots")
 
-    # Mock Markets
-    page.route("**/api/kalshi/markets*", lambda route: route.fulfill(json=MOCK_MARKETS))
+    def capture(name):
+        if not enabled:
+            return None
+        path = os.path.join("test-results", f"{request.node.name}-{name}.jpg")
+        os.makedirs("test-results", exist_ok=True)
+        page.screenshot(path=path, type="jpeg", quality=60)
+        logging.info("Saved screenshot to %s", path)
+        return path
 
-    # Mock Orders (GET/POST/DELETE)
-    def handle_orders(route):
-        if route.request.method == "GET":
-            route.fulfill(json=MOCK_ORDERS)
-        elif route.request.method == "POST":
-            route.fulfill(json=MOCK_ORDER_RESPONSE)
-        elif route.request.method == "DELETE":
-            route.fulfill(status=200, json={})
-        else:
-             route.continue_()
+    return capture
 
-    page.route("**/api/kalshi/portfolio/orders*", handle_orders)
+@pytest.fixture(scope="function")
+def browser_console(page):
+    """Opt-in: logs page errors, plus console messages when KALSHI_DEBUG_CONSOLE is set.
 
-    # Mock Positions (GET)
-    def handle_positions(route):
-        url = route.request.url
-        if "settlement_status=settled" in url:
-            route.fulfill(json=MOCK_HISTORY)
-        else:
-            route.fulfill(json=MOCK_POSITIONS)
+    Console output goes to the "kalshi.console" logger at DEBUG level, so it costs nothing
+    unless enabled and is captured by pytest rather than written to stdout per event.
+    """
+    logger = logging.getLogger("kalshi.console")
+    page.on("pageerror", lambda err: logger.warning("PAGE ERROR: %s", err))
+    if os.environ.get("KALSHI_DEBUG_CONSOLE"):
+        logger.setLevel(logging.DEBUG)
+        page.on("console", lambda msg: logger.debug("CONSOLE: %s", msg.text))
+    return page
 
-    page.route("**/api/kalshi/portfolio/positions*", handle_positions)
+@pytest.fixture(scope="function")
+def mock_api(context):
+    """Mocks Kalshi and The-Odds-API responses if enabled (NOT LIVE).
 
+    Routes are registered on the context, so they cover every page the test opens.
+    Tests that need different data shadow them with page.route(), which takes precedence.
+    Tests requesting this fixture directly are deselected in LIVE mode (see
+    pytest_collection_modifyitems).
+    """
+    install_default_mocks(context)
 
 @pytest.fixture(scope="function")
-def authenticated_page(page):
-    """Injects credentials into localStorage and reloads page."""
+def network_cache(context):
+    """LIVE mode: serves API GETs from .network-cache/ when KALSHI_CACHE_MODE is set.
+
+    KALSHI_CACHE_MODE=replay reuses recorded responses (fetching only what is missing);
+    KALSHI_CACHE_MODE=record refreshes them. Unset, every request goes to the real APIs.
+    """
+    mode = os.environ.get("KALSHI_CACHE_MODE")
+    if mode:
+        install_network_cache(context, mode)
+
+@pytest.fixture(scope="session")
+def mock_private_key():
+    """The mock key, read once per session (mock_key_pem caches it on disk)."""
+    return mock_key_pem()
+
+@pytest.fixture(scope="session")
+def auth_init_script(mock_private_key):
+    """Builds, once per session, the init script that seeds credentials into every page load.
 
+    The script runs before any app code, so no navigate/evaluate/reload round trip
+    is needed per test. Values are only written when absent so a reload keeps
+    whatever state the app saved.
+    """
     key_id = ""
     private_key = ""
     odds_key = os.environ.get("THE_ODDS_API_KEY", "mock_odds_key")
@@ -140,22 +296,50 @@ def authenticated_page(page):
                 pytest.fail("TEST_LIVE=1 but credentials not found in env or .secrets/.")
     else:
         key_id = "test_key_id"
-        # Generate dynamic key
-        private_key = generate_mock_key()
+        private_key = mock_private_key
 
-    # Navigate first to set local storage
-    page.goto("https://localhost:3000")
+    keys = json.dumps({"keyId": key_id, "privateKey": private_key})
+    return f"""
+        if (!sessionStorage.getItem('kalshi_keys')) {{
+            sessionStorage.setItem('kalshi_keys', {json.dumps(keys)});
+            sessionStorage.setItem('odds_api_key', {json.dumps(odds_key)});
+        }}
+    """
 
-    # We must properly escape newlines for JS template string
-    private_key_js = private_key.replace('\n', '\\n')
+@pytest.fixture(scope="session")
+def auth_storage_state():
+    """Storage state restored into seeded contexts: the mock trade history in localStorage.
 
-    page.evaluate(f"""() => {{
-        localStorage.setItem('kalshi_keys', JSON.stringify({{
-            keyId: '{key_id}',
-            privateKey: `{private_key_js}`
-        }}));
-        localStorage.setItem('odds_api_key', '{odds_key}');
-    }}""")
+    Playwright's storage state only covers cookies and localStorage, so the sessionStorage
+    credentials still come from auth_init_script. Nothing is seeded in LIVE mode.
+    """
+    if TEST_LIVE:
+        return None
+    return {
+        "cookies": [],
+        "origins": [{
+            "origin": VITE_URL,
+            "localStorage": [{"name": "kalshi_trade_history", "value": json.dumps(MOCK_TRADE_HISTORY)}],
+        }],
+    }
+
+@pytest.fixture(scope="function")
+def seeded_page(page, request):
+    """A page whose context is seeded with credentials and trade history, not yet navigated.
 
-    page.reload()
+    Requires @pytest.mark.seeded on the test (or its module), which seeds the context as it is created.
+    In mock mode, mock_api is installed first so the initial load is already served by the mocks;
+    in LIVE mode, network_cache is (a no-op unless KALSHI_CACHE_MODE is set).
+    Tests that register their own page.route() overrides use this and call page.goto() once
+    afterwards, instead of loading the dashboard and reloading it.
+    """
+    if not request.node.get_closest_marker("seeded"):
+        pytest.fail("seeded_page needs @pytest.mark.seeded; without it the context is created unseeded.")
+    request.getfixturevalue("network_cache" if TEST_LIVE else "mock_api")
     return page
+
+@pytest.fixture(scope="function")
+def authenticated_page(seeded_page, vite_url):
+    """Opens the dashboard with credentials seeded and, in mock mode, the default mocks installed."""
+    seeded_page.goto(vite_url)
+    return seeded_page
@@ -1,4 +1,5 @@
 # Mock data for Kalshi API
+import json
 
 MOCK_BALANCE = {
     "balance": 1000000 # 10,000.00 USD
@@ -78,3 +79,33 @@ MOCK_ORDER_RESPONSE = {
     "order_id": "ord_new_456",
     "status": "placed"
 }
+
+# Local trade history the dashboard keeps in localStorage (keyed by ticker)
+MOCK_TRADE_HISTORY = {
+    "KXNBAGAME-23OCT20-LAL-DEN": {
+        "ticker": "KXNBAGAME-23OCT20-LAL-DEN",
+        "event": "Lakers vs Nuggets",
+        "source": "auto",
+        "fairValue": 35,
+        "bidPrice": 30,
+        "orderPlacedAt": 1697817600000
+    }
+}
+
+# Mock data for The-Odds-API
+MOCK_SPORTS = [
+    {"key": "americanfootball_nfl", "title": "NFL", "active": True}
+]
+
+MOCK_ODDS = []
+
+# Pre-serialized bodies so route handlers never re-run json.dumps per request
+MOCK_BALANCE_JSON = json.dumps(MOCK_BALANCE).encode()
+MOCK_MARKETS_JSON = json.dumps(MOCK_MARKETS).encode()
+MOCK_ORDERS_JSON = json.dumps(MOCK_ORDERS).encode()
+MOCK_POSITIONS_JSON = json.dumps(MOCK_POSITIONS).encode()
+MOCK_HISTORY_JSON = json.dumps(MOCK_HISTORY).encode()
+MOCK_ORDER_RESPONSE_JSON = json.dumps(MOCK_ORDER_RESPONSE).encode()
+MOCK_SPORTS_JSON = json.dumps(MOCK_SPORTS).encode()
+MOCK_ODDS_JSON = json.dumps(MOCK_ODDS).encode()
+EMPTY_JSON = b"{}"
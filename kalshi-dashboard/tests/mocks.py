@@ -0,0 +1,51 @@
+# Default route mocks for the Kalshi proxy and The-Odds-API
+from testkit.routes import ODDS_API_RE, fulfill_json, route_kalshi
+from .mock_data import (
+    MOCK_BALANCE_JSON, MOCK_MARKETS_JSON, MOCK_ORDERS_JSON, MOCK_POSITIONS_JSON, MOCK_HISTORY_JSON,
+    MOCK_ORDER_RESPONSE_JSON, MOCK_SPORTS_JSON, MOCK_ODDS_JSON, EMPTY_JSON,
+)
+
+# Mock Orders (GET/POST/DELETE)
+def default_orders(route):
+    if route.request.method == "GET":
+        fulfill_json(route, MOCK_ORDERS_JSON)
+    elif route.request.method == "POST":
+        fulfill_json(route, MOCK_ORDER_RESPONSE_JSON)
+    elif route.request.method == "DELETE":
+        fulfill_json(route, EMPTY_JSON)
+    else:
+        route.continue_()
+
+# Mock Positions (GET)
+def default_positions(route):
+    if "settlement_status=settled" in route.request.url:
+        fulfill_json(route, MOCK_HISTORY_JSON)
+    else:
+        fulfill_json(route, MOCK_POSITIONS_JSON)
+
+# Mock The-Odds-API (sports list and per-sport odds)
+def default_odds(route):
+    if "/odds/" in route.request.url:
+        fulfill_json(route, MOCK_ODDS_JSON)
+    else:
+        fulfill_json(route, MOCK_SPORTS_JSON)
+
+DEFAULT_HANDLERS = {
+    "balance": lambda route: fulfill_json(route, MOCK_BALANCE_JSON),
+    "markets": lambda route: fulfill_json(route, MOCK_MARKETS_JSON),
+    "orders": default_orders,
+    "positions": default_positions,
+    "odds": default_odds,
+}
+
+def install_default_mocks(target, overrides=None):
+    """Registers the default mocks on a Page or BrowserContext.
+
+    overrides maps an endpoint name ("balance", "markets", "orders", "positions", "odds")
+    to a handler used instead of the default. Returns the handler dict in use; handlers are
+    looked up per request, so a test can swap one mid-test by assigning into it.
+    """
+    handlers = {**DEFAULT_HANDLERS, **(overrides or {})}
+    route_kalshi(target, handlers)
+    target.route(ODDS_API_RE, lambda route: handlers["odds"](route))
+    return handlers
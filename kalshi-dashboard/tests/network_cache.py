@@ -0,0 +1,58 @@
+# Record/replay cache for live API responses (TEST_LIVE runs only)
+import hashlib
+import json
+import logging
+import os
+import re
+
+CACHE_DIR = ".network-cache"
+CACHE_MODES = ("record", "replay")
+
+# The Kalshi proxy and The-Odds-API; the same endpoints the mocks cover in mock mode
+LIVE_API_RE = re.compile(r"(/api/kalshi/|^https://api\.the-odds-api\.com/)")
+
+# The cached body is stored decoded, so transfer-level headers no longer describe it
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+def cache_path(request):
+    """Cache file for a request, keyed on method, URL and body.
+
+    The URL is only hashed, never written out: Odds API URLs carry the API key.
+    """
+    key = f"{request.method} {request.url} {request.post_data or ''}"
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+def install_network_cache(target, mode):
+    """Routes live API GETs on a Page or BrowserContext through the on-disk cache.
+
+    "replay" serves cached responses and fetches (and stores) only what is missing;
+    "record" always fetches and overwrites the cache. Anything but a GET, e.g. an
+    order, always goes to the network and is never cached.
+    """
+    if mode not in CACHE_MODES:
+        raise ValueError(f"KALSHI_CACHE_MODE must be one of {CACHE_MODES}, got {mode!r}")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    def handle(route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        path = cache_path(request)
+        if mode == "replay" and os.path.exists(path):
+            with open(path) as f:
+                cached = json.load(f)
+            route.fulfill(status=cached["status"], headers=cached["headers"], body=cached["body"])
+            return
+
+        response = route.fetch()
+        body = response.text()
+        if response.ok:
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS}
+            with open(path, "w") as f:
+                json.dump({"status": response.status, "headers": headers, "body": body}, f)
+            logging.debug("Cached %s %s", request.method, path)
+        route.fulfill(response=response, body=body)
+
+    target.route(LIVE_API_RE, handle)
@@ -1,13 +1,13 @@
 import pytest
 from playwright.sync_api import expect
-import time
 
-def test_load_dashboard(page, mock_api):
+def test_load_dashboard(page, mock_api, vite_url):
     """Test that the dashboard loads correctly without crashing."""
-    page.goto("https://localhost:3000")
+    page.goto(vite_url)
     expect(page.get_by_text("Kalshi ArbBot")).to_be_visible()
     expect(page.get_by_text("Connect Wallet")).to_be_visible()
 
+@pytest.mark.seeded
 def test_connect_wallet(authenticated_page, mock_api):
     """Test that injecting keys connects the wallet."""
     # The authenticated_page fixture already injects keys and reloads
@@ -15,22 +15,20 @@ def test_connect_wallet(authenticated_page, mock_api):
     expect(authenticated_page.get_by_text("Wallet Active")).to_be_visible(timeout=10000)
 
     # Check if balance is displayed (mocked to 10000.00)
-    time.sleep(2)
-    expect(authenticated_page.get_by_text("10000.00")).to_be_visible()
+    expect(authenticated_page.get_by_text("10000.00")).to_be_visible(timeout=10000)
 
+@pytest.mark.seeded
 def test_market_scanner_display(authenticated_page, mock_api):
     """Test that markets are displayed in the scanner."""
     # Ensure markets table is visible
     expect(authenticated_page.get_by_text("Market Scanner")).to_be_visible()
     pass
 
+@pytest.mark.seeded
 def test_portfolio_positions(authenticated_page, mock_api):
     """Test that positions are displayed in the Portfolio section."""
     # Click Positions tab
-    authenticated_page.get_by_role("button", name="positions").click()
-
-    # Wait for data
-    time.sleep(2)
+    authenticated_page.get_by_role("tab", name="positions").click()
 
     # MOCK_POSITIONS has "KXNBAGAME-23OCT26-LAL-PHX"
     # Identify item row (has class 'group') by text content "PHX"
@@ -40,13 +38,11 @@ def test_portfolio_positions(authenticated_page, mock_api):
 
     # Quantity is not shown in positions tab column.
 
+@pytest.mark.seeded
 def test_portfolio_resting_orders(authenticated_page, mock_api):
     """Test that resting orders are displayed."""
     # Default tab is usually resting
-    authenticated_page.get_by_role("button", name="resting").click()
-
-    # Wait for data
-    time.sleep(2)
+    authenticated_page.get_by_role("tab", name="resting").click()
 
     # MOCK_ORDERS has "KXNFLGAME-23OCT26-BUF-TB" -> TB
     # Identify item row (has class 'group') by text content
@@ -56,13 +52,11 @@ def test_portfolio_resting_orders(authenticated_page, mock_api):
     # Quantity 10. The UI shows "0 / 10" (filled / qty).
     expect(row).to_contain_text("/ 10")
 
+@pytest.mark.seeded
 def test_portfolio_history(authenticated_page, mock_api):
     """Test that trade history is displayed."""
     # Click History tab
-    authenticated_page.get_by_role("button", name="history").click()
-
-    # Wait for data
-    time.sleep(2)
+    authenticated_page.get_by_role("tab", name="history").click()
 
     # MOCK_HISTORY has "KXNBAGAME-23OCT20-LAL-DEN"
     # We mocked tradeHistory in localStorage with event "Lakers vs Nuggets"
@@ -75,6 +69,7 @@ def test_portfolio_history(authenticated_page, mock_api):
     # Payout check skipped as it renders '-' due to data mapping issue.
     pass
 
+@pytest.mark.seeded
 def test_strategy_configuration(authenticated_page, mock_api):
     """Test that strategy settings can be updated."""
     # Open Settings
@@ -3,6 +3,8 @@ from playwright.sync_api import expect
 import time
 import os
 
+pytestmark = pytest.mark.seeded
+
 # Skip these tests if not in LIVE mode
 @pytest.mark.skipif(os.environ.get("TEST_LIVE") != "1", reason="Running in MOCK mode")
 def test_live_connectivity(authenticated_page):
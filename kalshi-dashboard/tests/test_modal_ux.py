@@ -1,24 +1,17 @@
 import pytest
-import json
 from playwright.sync_api import expect
 
+pytestmark = pytest.mark.seeded
+
 def test_modal_keyboard_interaction(authenticated_page):
+    # External APIs are served by the default context mocks, so the UI loads cleanly
     page = authenticated_page
 
-    # Mock External APIs to ensure UI loads cleanly
-    page.route("**/*api.the-odds-api.com/*", lambda r: r.fulfill(
-        status=200, content_type="application/json", body=json.dumps([{"key": "americanfootball_nfl", "title": "NFL", "active": True}])
-    ))
-    page.route("**/api/kalshi/markets*", lambda r: r.fulfill(json={"markets": []}))
-
-    page.reload()
-
-    # Wait for hydration
-    page.wait_for_timeout(1000)
-
     # 1. Settings Modal
     print("Testing Settings Modal...")
     settings_btn = page.get_by_label("Settings")
+    # Wait for hydration by polling for the header button rather than a fixed delay
+    expect(settings_btn).to_be_visible()
     settings_btn.click()
     expect(page.get_by_text("Bot Configuration")).to_be_visible()
 
@@ -33,8 +26,9 @@ def test_modal_keyboard_interaction(authenticated_page):
     expect(page.get_by_text("Bot Configuration")).to_be_visible()
 
     # Click on the backdrop.
-    # The modal is centered. A click at (10, 10) should hit the overlay (which covers inset-0).
-    page.mouse.click(10, 10)
+    # The modal is centered, so the overlay's top-left corner is outside the dialog.
+    backdrop = page.get_by_test_id("modal-backdrop")
+    backdrop.click(position={"x": 5, "y": 5})
     expect(page.get_by_text("Bot Configuration")).not_to_be_visible()
 
     # 3. Schedule Modal
@@ -52,5 +46,5 @@ def test_modal_keyboard_interaction(authenticated_page):
     reports_btn.click()
     expect(page.get_by_text("Session Reports")).to_be_visible()
 
-    page.mouse.click(10, 10) # Click backdrop
+    backdrop.click(position={"x": 5, "y": 5}) # Click backdrop
     expect(page.get_by_text("Session Reports")).not_to_be_visible()
@@ -1,9 +1,13 @@
 import pytest
 import json
-import time
+import itertools
 import re
 from datetime import datetime
 from playwright.sync_api import expect
+from testkit.routes import JSON
+from .mocks import install_default_mocks
+
+pytestmark = pytest.mark.seeded
 
 # --- MOCK DATA GENERATORS ---
 
@@ -66,87 +70,97 @@ def generate_kalshi_markets(ticker="KXNFLGAME-23OCT26-TB-BUF", yes_bid=55, yes_a
         ]
     }
 
-# --- TESTS ---
-
-def test_e2e_arbitrage_cycle(authenticated_page):
-    """
-    Test the full lifecycle.
-    Note: We do NOT use 'mock_api' fixture here to avoid conflicts.
-    We define all routes explicitly.
-    """
-    page = authenticated_page
-
-    # Capture Console Logs & Requests
-    page.on("console", lambda msg: print(f"CONSOLE: {msg.text}"))
-    page.on("pageerror", lambda err: print(f"PAGE ERROR: {err}"))
-
-    # 1. SETUP MOCKS
-    # ----------------
-
-    # Mock Odds API
-    def handle_odds_api(route):
-        url = route.request.url
-        # print(f"Intercepted Odds API: {url}")
-
-        if "/odds/" in url:
-             odds_response = generate_odds_response("2023-10-26T20:00:00Z")
-             route.fulfill(
-                status=200,
-                content_type="application/json",
-                body=json.dumps(odds_response),
-                headers={"x-requests-used": "0", "x-requests-remaining": "500"}
-            )
-        else:
-             # Sports List
-             route.fulfill(
-                status=200,
-                content_type="application/json",
-                body=json.dumps([{"key": "americanfootball_nfl", "title": "NFL", "active": True}])
-            )
-
-    page.route(lambda url: "api.the-odds-api.com" in url, handle_odds_api)
+# The odds last_update is import time, well inside the app's one-hour "ancient data" cutoff
+RATE_HEADERS = {"x-requests-used": "0", "x-requests-remaining": "500"}
+SPORTS_BODY = json.dumps([{"key": "americanfootball_nfl", "title": "NFL", "active": True}]).encode()
+ODDS_BODY = json.dumps(generate_odds_response("2023-10-26T20:00:00Z")).encode()
+MARKETS_ARB_BODY = json.dumps(generate_kalshi_markets(yes_bid=40, yes_ask=45)).encode()
+MARKETS_HIGH_BODY = json.dumps(generate_kalshi_markets(yes_bid=50, yes_ask=55)).encode()
+MARKETS_SETTINGS_BODY = json.dumps(generate_kalshi_markets(yes_bid=40)).encode()
+BALANCE_BODY = b'{"balance": 100000}'
+EMPTY_ORDERS_BODY = b'{"orders": []}'
+EMPTY_POSITIONS_BODY = b'{"market_positions": []}'
+
+# The orders list only (query string optional); per-order paths such as DELETE are routed separately
+ORDERS_LIST_RE = re.compile(r"/api/kalshi/portfolio/orders(?:\?.*)?$")
+
+def fulfill_body(body):
+    """Returns a route handler that serves a prebuilt JSON body."""
+    return lambda route: route.fulfill(status=200, content_type=JSON, body=body)
+
+def handle_odds_api(route):
+    """Serves the sports list, or the arbitrage odds fixture for /odds/ requests."""
+    if "/odds/" in route.request.url:
+        route.fulfill(status=200, content_type=JSON, body=ODDS_BODY, headers=RATE_HEADERS)
+    else:
+        route.fulfill(status=200, content_type=JSON, body=SPORTS_BODY)
+
+ARB_TICKER = "KXNFLGAME-23OCT26-TB-BUF"
+# MarketRow test id, keyed by the odds event id
+ARB_ROW_TEST_ID = "market-row-event_123"
+FILLED_POSITIONS_BODY = json.dumps({
+    "market_positions": [
+        {
+            "ticker": ARB_TICKER,
+            "market_ticker": ARB_TICKER,
+            "position": 10,
+            "avg_price": 41,
+            "total_cost": 410,
+            "fees_paid": 5,
+            "settlement_status": "unsettled"
+        }
+    ]
+}).encode()
+# What the app records after the bot's buy in test_bot_places_buy_order
+ARB_TRADE_HISTORY_JSON = json.dumps({
+    ARB_TICKER: {
+        "ticker": ARB_TICKER,
+        "event": "Buffalo Bills vs Tampa Bay Buccaneers",
+        "source": "auto",
+        "fairValue": 60,
+        "bidPrice": 45,
+        "orderPlacedAt": 1698321600000
+    }
+})
 
-    # Mock Kalshi Markets
-    def handle_kalshi_markets(route):
-        # print(f"Intercepted Kalshi Markets: {route.request.url}")
-        kalshi_market_response = generate_kalshi_markets(yes_bid=40, yes_ask=45)
-        route.fulfill(json=kalshi_market_response)
+# Mock Positions - Filled State
+# Crucial: Filter out settled requests to avoid duplicates
+def handle_positions_filled(route):
+    if "settlement_status=settled" in route.request.url:
+        route.fulfill(content_type=JSON, body=EMPTY_POSITIONS_BODY)
+    else:
+        route.fulfill(content_type=JSON, body=FILLED_POSITIONS_BODY)
 
-    page.route("**/api/kalshi/markets*", handle_kalshi_markets)
+def install_arb_cycle_mocks(page, markets=None, positions=None):
+    """Overrides every endpoint on the page for the arbitrage cycle.
 
-    # Mock Balance
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json={"balance": 100000}))
+    Page routes take precedence over the default context mocks installed by mock_api.
+    POSTed orders are accepted; tests observe them with page.expect_request(order_post(...)).
+    """
+    order_ids = itertools.count(1)
 
-    # Mock Orders (Shared Capture)
-    captured_orders = []
+    # Mock Orders (accept every POST)
     def handle_orders(route):
         if route.request.method == "GET":
-             route.fulfill(json={"orders": []})
+             route.fulfill(content_type=JSON, body=EMPTY_ORDERS_BODY)
         elif route.request.method == "POST":
-             data = route.request.post_data_json
-             print(f"Intercepted POST Order: {data}")
-             captured_orders.append(data)
-             route.fulfill(json={"order_id": f"ord_{len(captured_orders)}", "status": "placed"})
+             route.fulfill(json={"order_id": f"ord_{next(order_ids)}", "status": "placed"})
         else:
              route.continue_()
 
-    page.route("**/api/kalshi/portfolio/orders*", handle_orders)
-
-    # Mock Positions - Initial (Empty)
-    def handle_positions(route):
-        if "settlement_status=settled" in route.request.url:
-            route.fulfill(json={"market_positions": []})
-        else:
-            route.fulfill(json={"market_positions": []})
-    page.route("**/api/kalshi/portfolio/positions*", handle_positions)
-
-    # 2. VERIFY ARB OPPORTUNITY
-    # -------------------------
-    page.reload()
-
-    # Wait for market row to appear
+    return install_default_mocks(page, overrides={
+        "odds": handle_odds_api,
+        "markets": markets or fulfill_body(MARKETS_ARB_BODY),
+        "balance": fulfill_body(BALANCE_BODY),
+        "orders": handle_orders,
+        # Positions - Initial (Empty) unless overridden
+        "positions": positions or fulfill_body(EMPTY_POSITIONS_BODY),
+    })
+
+def wait_for_arb_row(page):
+    """Waits for the arbitrage market row and returns it."""
     try:
-        row = page.locator("tr").filter(has_text="Buffalo Bills").first
+        row = page.get_by_test_id(ARB_ROW_TEST_ID)
         expect(row).to_be_visible(timeout=10000)
     except AssertionError:
         if page.get_by_text("Loading Markets...").is_visible():
@@ -154,86 +168,88 @@ def test_e2e_arbitrage_cycle(authenticated_page):
         else:
             print("Markets table empty or mismatch.")
         raise
+    return row
 
-    # Check Smart Bid calculation
-    # Alpha Refinement: With Ask 45 and MaxWilling ~51, we now cross the spread to 45
-    expect(row.get_by_text("45¢", exact=True)).to_be_visible()
-
-    # 3. START BOT & VERIFY BUY ORDER
-    # -------------------------------
-    # Click Start
+def start_bot(page, auto_bid):
+    """Starts the bot in Turbo Mode, with Auto-Bid switched on or off."""
     page.get_by_text("Start").click()
 
     # Enable Turbo Mode for faster polling
     page.locator("button:has(svg.lucide-zap)").click()
 
-    # Enable Auto-Bid if needed
-    if page.get_by_text("Auto-Bid OFF").is_visible():
-        page.get_by_text("Auto-Bid OFF").click()
+    toggle = page.get_by_text("Auto-Bid OFF" if auto_bid else "Auto-Bid ON")
+    if toggle.is_visible():
+        toggle.click()
 
-    # Wait for the bot to run cycle
-    time.sleep(5)
+def order_post(action):
+    """Request predicate for a POSTed order with the given action ("buy" or "sell")."""
+    def matches(request):
+        if request.method != "POST" or not ORDERS_LIST_RE.search(request.url):
+            return False
+        return (request.post_data_json or {}).get("action") == action
+    return matches
 
-    # Verify Order Captured
-    assert len(captured_orders) > 0, "Bot did not place a buy order"
-    order = captured_orders[0]
-    assert order["action"] == "buy"
-    assert order["ticker"] == "KXNFLGAME-23OCT26-TB-BUF"
-    assert order["yes_price"] == 45
+# --- TESTS ---
 
-    print("Buy Order Verified!")
+# The arbitrage cycle (arb -> buy -> fill -> auto-close) is split into one test per phase.
+# Each later phase starts directly in the state the previous one would have produced.
 
-    # 4. SIMULATE FILL & HOLDING
-    # --------------------------
-    mock_positions = {
-        "market_positions": [
-            {
-                "ticker": "KXNFLGAME-23OCT26-TB-BUF",
-                "market_ticker": "KXNFLGAME-23OCT26-TB-BUF",
-                "position": 10,
-                "avg_price": 41,
-                "total_cost": 410,
-                "fees_paid": 5,
-                "settlement_status": "unsettled"
-            }
-        ]
-    }
+def test_arb_opportunity_smart_bid(seeded_page, browser_console, vite_url):
+    """The arbitrage market shows up with the expected smart bid."""
+    page = seeded_page
+    install_arb_cycle_mocks(page)
+    page.goto(vite_url)
 
-    # Mock Positions - Filled State
-    # Crucial: Filter out settled requests to avoid duplicates
-    def handle_positions_filled(route):
-        if "settlement_status=settled" in route.request.url:
-            route.fulfill(json={"market_positions": []})
-        else:
-            route.fulfill(json=mock_positions)
+    row = wait_for_arb_row(page)
+
+    # Check Smart Bid calculation
+    # Alpha Refinement: With Ask 45 and MaxWilling ~51, we now cross the spread to 45
+    expect(row.get_by_text("45¢", exact=True)).to_be_visible()
 
-    page.unroute("**/api/kalshi/portfolio/positions*") # Remove old handler
-    page.route("**/api/kalshi/portfolio/positions*", handle_positions_filled)
 
-    # Trigger a portfolio refresh
-    time.sleep(6)
+def test_bot_places_buy_order(seeded_page, browser_console, vite_url):
+    """Starting the bot with Auto-Bid places a buy at the smart bid."""
+    page = seeded_page
+    install_arb_cycle_mocks(page)
+    page.goto(vite_url)
+    wait_for_arb_row(page)
+
+    # Returns as soon as the bot's first cycle sends the buy
+    with page.expect_request(order_post("buy"), timeout=10000) as buy_info:
+        start_bot(page, auto_bid=True)
+
+    # Verify Order Captured
+    order = buy_info.value.post_data_json
+    assert order["action"] == "buy"
+    assert order["ticker"] == ARB_TICKER
+    assert order["yes_price"] == 45
+
+
+def test_filled_position_displayed(seeded_page, browser_console, vite_url):
+    """A filled order shows up as a held position."""
+    page = seeded_page
+    install_arb_cycle_mocks(page, positions=handle_positions_filled)
+    page.goto(vite_url)
 
     # Verify Position Tab
-    page.get_by_role("button", name="positions").click()
-    expect(page.locator("tr").filter(has_text="BUF").filter(has_text="10").first).to_be_visible()
+    page.get_by_role("tab", name="positions").click()
+    expect(page.locator("tr").filter(has_text="BUF").filter(has_text="10").first).to_be_visible(timeout=10000)
+
 
-    print("Position Verified!")
+def test_auto_close_after_price_jump(seeded_page, browser_console, vite_url):
+    """A bot-opened position is offered for sale once the price jumps."""
+    page = seeded_page
+    # Auto-close only touches positions the bot opened, i.e. those in trade history
+    page.add_init_script(script=f"localStorage.setItem('kalshi_trade_history', {json.dumps(ARB_TRADE_HISTORY_JSON)});")
 
-    # 5. SIMULATE PRICE JUMP (AUTO-CLOSE)
-    # -----------------------------------
-    # Update Market Mock to Higher Price
     # Price needs to be high enough to trigger auto-close.
     # Avg Price 41. Margin 15%. Target = 41 * 1.15 = 47.15.
     # Bid needs to be >= 48.
+    install_arb_cycle_mocks(page, markets=fulfill_body(MARKETS_HIGH_BODY), positions=handle_positions_filled)
+    page.goto(vite_url)
 
-    def handle_high_markets(route):
-        kalshi_market_high = generate_kalshi_markets(yes_bid=50, yes_ask=55)
-        route.fulfill(json=kalshi_market_high)
-    page.unroute("**/api/kalshi/markets*")
-    page.route("**/api/kalshi/markets*", handle_high_markets)
-
-    # Wait for market update to reflect high price
-    # We expect "50¢" (Bid) to appear in the table
+    # We expect "50¢" (Bid) to appear next to the held position
+    page.get_by_role("tab", name="positions").click()
     try:
         expect(page.locator("tr").filter(has_text="BUF").filter(has_text="50¢").first).to_be_visible(timeout=15000)
     except AssertionError:
@@ -241,21 +257,16 @@ def test_e2e_arbitrage_cycle(authenticated_page):
         raise
 
     # Wait for auto-close logic to trigger (it runs on effect after market update)
-    time.sleep(5)
+    with page.expect_request(order_post("sell"), timeout=10000) as sell_info:
+        start_bot(page, auto_bid=False)
 
-    # Verify Sell Order
-    # We expect a new order in captured_orders
-    assert len(captured_orders) >= 2, "Bot did not trigger auto-close"
-    sell = captured_orders[-1]
-    assert sell["action"] == "sell"
-    assert sell["ticker"] == "KXNFLGAME-23OCT26-TB-BUF"
+    sell = sell_info.value.post_data_json
+    assert sell["ticker"] == ARB_TICKER
 
-    print("Auto-Close Verified!")
 
-
-def test_portfolio_management(authenticated_page, mock_api):
+def test_portfolio_management(seeded_page, mock_api, vite_url):
     """Test cancelling resting orders."""
-    page = authenticated_page
+    page = seeded_page
 
     # Mock a resting order
     mock_orders = {
@@ -273,48 +284,34 @@ def test_portfolio_management(authenticated_page, mock_api):
             }
         ]
     }
-    # Note: mock_api is active here, but we override specific route
-    page.route("**/api/kalshi/portfolio/orders*", lambda route: route.fulfill(json=mock_orders))
-
-    delete_called = False
-    def handle_delete(route):
-        nonlocal delete_called
-        delete_called = True
-        route.fulfill(status=200, json={})
+    # Note: mock_api's context routes stay active; this page route overrides only orders
+    page.route(ORDERS_LIST_RE, fulfill_body(json.dumps(mock_orders).encode()))
 
-    page.route("**/api/kalshi/portfolio/orders/ord_resting_1", handle_delete)
+    page.route("**/api/kalshi/portfolio/orders/ord_resting_1", fulfill_body(b"{}"))
 
-    page.reload()
+    page.goto(vite_url)
     cancel_btn = page.locator("button[title='Cancel Order']").first
     expect(cancel_btn).to_be_visible()
 
     page.on("dialog", lambda dialog: dialog.accept())
-    cancel_btn.click()
-
-    # Bernie says: Increased wait time to reduce flakiness
-    time.sleep(5)
-    assert delete_called, "DELETE API was not called"
+    # Returns as soon as the DELETE is sent; times out (failing the test) if it never is
+    with page.expect_request(
+        lambda r: r.method == "DELETE" and r.url.endswith("/portfolio/orders/ord_resting_1"), timeout=10000
+    ):
+        cancel_btn.click()
 
 
-def test_settings_impact(authenticated_page):
+def test_settings_impact(seeded_page, vite_url):
     """Test that changing settings affects calculations."""
-    page = authenticated_page
-
-    # Mock Odds API
-    page.route(lambda url: "api.the-odds-api.com" in url, lambda route: route.fulfill(
-        status=200,
-        content_type="application/json",
-        body=json.dumps(generate_odds_response("2023-10-26T20:00:00Z") if "/odds/" in route.request.url else [{"key": "americanfootball_nfl", "title": "NFL", "active": True}])
-    ))
-
-    kalshi_market_response = generate_kalshi_markets(yes_bid=40)
-    page.route("**/api/kalshi/markets*", lambda route: route.fulfill(json=kalshi_market_response))
+    page = seeded_page
 
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json={"balance": 100000}))
-    page.route("**/api/kalshi/portfolio/orders*", lambda route: route.fulfill(json={"orders": []}))
-    page.route("**/api/kalshi/portfolio/positions*", lambda route: route.fulfill(json={"market_positions": []}))
+    # Balance, orders and positions keep their defaults
+    install_default_mocks(page, overrides={
+        "odds": handle_odds_api,
+        "markets": fulfill_body(MARKETS_SETTINGS_BODY),
+    })
 
-    page.reload()
+    page.goto(vite_url)
 
     expect(page.get_by_text("41¢", exact=True)).to_be_visible()
 
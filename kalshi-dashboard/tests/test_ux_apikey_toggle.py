@@ -1,31 +1,15 @@
 import pytest
-import json
 from playwright.sync_api import expect
 
-# --- MOCK DATA ---
-def generate_odds_response():
-    return [{"key": "americanfootball_nfl", "title": "NFL", "active": True}]
-
-def generate_kalshi_markets():
-    return {"markets": []}
-
+@pytest.mark.seeded
 def test_apikey_visibility_toggle(authenticated_page):
     """
     Verify that the API Key input can toggle between password and text types.
     """
     page = authenticated_page
 
-    # 1. SETUP MOCKS
-    # We mock the API calls to prevent the dashboard from stalling or erroring out
-    page.route(lambda url: "api.the-odds-api.com" in url, lambda route: route.fulfill(
-        status=200, content_type="application/json", body=json.dumps(generate_odds_response())
-    ))
-    page.route("**/api/kalshi/markets*", lambda route: route.fulfill(json=generate_kalshi_markets()))
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json={"balance": 100000}))
-    page.route("**/api/kalshi/portfolio/orders*", lambda route: route.fulfill(json={"orders": []}))
-    page.route("**/api/kalshi/portfolio/positions*", lambda route: route.fulfill(json={"market_positions": []}))
-
-    page.reload()
+    # 1. MOCKS
+    # The default context mocks keep the dashboard from stalling or erroring out
 
     # 2. Open Settings Modal
     settings_btn = page.get_by_label("Settings")
@@ -2,14 +2,18 @@ import pytest
 from playwright.sync_api import expect
 import re
 
-def test_connect_modal_ux(page):
+# Drop zone hover classes, compiled once
+HOVER_BG = re.compile(r"hover:bg-slate-50")
+HOVER_BORDER = re.compile(r"hover:border-blue-400")
+
+def test_connect_modal_ux(page, vite_url):
     """
     Verify the UX improvements in the Connect Modal:
     - Proper labels for API Key ID and Private Key
     - Improved file drop zone visual structure
     - Status indicators
     """
-    page.goto("https://localhost:3000")
+    page.goto(vite_url)
 
     # Open Connect Modal
     connect_btn = page.get_by_role("button", name="Connect Wallet")
@@ -54,5 +58,5 @@ def test_connect_modal_ux(page):
     drop_zone = page.locator('input[type="file"]').locator("..")
 
     # Check for hover styles
-    expect(drop_zone).to_have_class(re.compile(r"hover:bg-slate-50"))
-    expect(drop_zone).to_have_class(re.compile(r"hover:border-blue-400"))
+    expect(drop_zone).to_have_class(HOVER_BG)
+    expect(drop_zone).to_have_class(HOVER_BORDER)
@@ -1,16 +1,12 @@
 import pytest
 from playwright.sync_api import expect
-import time
-import os
 import logging
+from ._env import TEST_LIVE
 
-# We use the existing TEST_LIVE determination logic from conftest,
-# but since we can't import variables from conftest easily without a module,
-# we rely on the fixture behavior or check env again.
-TEST_LIVE = os.environ.get("TEST_LIVE") == "1" or ("KALSHI_DEMO_API_KEY" in os.environ and "KALSHI_DEMO_API_KEY_ID" in os.environ)
+pytestmark = pytest.mark.seeded
 
 @pytest.mark.skipif(not TEST_LIVE, reason="Skipping Live Data Validation because keys are missing")
-def test_live_data_validation(authenticated_page):
+def test_live_data_validation(authenticated_page, debug_screenshot, vite_url):
     """
     Connects to real APIs and validates data structures.
     This test runs only if API keys are present.
@@ -40,28 +36,22 @@ def test_live_data_validation(authenticated_page):
     logging.info("Verifying Odds API Connection...")
 
     # Enable multiple sports to ensure we find active markets (NFL might be off)
-    # Click the "Select Sports" dropdown
-    try:
-        page.get_by_text("Select Sports").click()
-    except:
-        # If text is different (e.g. "1 Sport"), try finding by role
-        page.locator("button:has-text('Sport')").first.click()
+    # Open the sport filter; its label is stable while its text changes ("Select Sports", "1 Sport", ...)
+    page.get_by_label("Filter by Sport").click()
 
     # Select NBA and NHL if available in the dropdown
     # We click them to toggle ON
     for sport in ["Basketball (NBA)", "Hockey (NHL)", "Basketball (NCAAB)"]:
-        try:
-            # Only click if not already selected (checked)
-            # The dropdown item shows a Check icon if selected.
-            # We just click; the app toggles. If it was on, it turns off.
-            # But defaults are usually just NFL.
-
-            # Check if visible
-            if page.get_by_text(sport).is_visible():
-                page.get_by_text(sport).click()
-                time.sleep(0.5)
-        except:
-            pass
+        # We just click; the app toggles. If it was on, it turns off.
+        # But defaults are usually just NFL.
+        # is_visible() doesn't throw or wait, so sports missing from the list are simply skipped
+        option = page.get_by_text(sport, exact=True)
+        if option.is_visible():
+            # Wait for the toggle to render (its check icon appears or disappears), not a fixed delay
+            check = page.get_by_role("button").filter(has=option).locator("svg.lucide-check")
+            was_selected = check.count() > 0
+            option.click()
+            expect(check).to_have_count(0 if was_selected else 1, timeout=1000)
 
     # Close dropdown by clicking outside (header)
     page.get_by_text("Kalshi ArbBot").click()
@@ -74,8 +64,9 @@ def test_live_data_validation(authenticated_page):
     try:
         expect(page.get_by_text("Loading Markets...")).not_to_be_visible(timeout=20000)
     except AssertionError:
-        # If it's still loading, capture screenshot for debug (if we could)
+        # If it's still loading, capture screenshot for debug (with --screenshots)
         logging.error("Markets failed to load within 20s.")
+        debug_screenshot("markets-loading")
         raise
 
     # Check network activity to confirm Odds API was called
@@ -84,26 +75,20 @@ def test_live_data_validation(authenticated_page):
 
     # 3. Validate Market Data Integrity
     # ---------------------------------
-    # If markets are present, check their structure
-    rows = page.locator("tr.hover\\:bg-slate-50")
-    count = rows.count()
-    logging.info(f"Found {count} market rows.")
-
-    if count > 0:
-        first_row = rows.first
-        # Check for presence of essential data columns
-        # Ticker/Event info
-        expect(first_row.locator("td").first).not_to_be_empty()
-
-        # Odds Column (should contain percentage or price)
-        # We look for the "Smart Bid" or any numeric value in the odds section
-        # The structure is specific, but text usually contains a '¢' for Kalshi price
-        # or a probability %.
-
-        # Verify at least one '¢' symbol in the row, indicating Kalshi data is merged?
-        # Or just verify Odds data (implied probability).
-        pass
-    else:
+    # Structure is checked on the raw API response (through the dev server proxy), not by
+    # scanning rendered rows. The markets list is public, so no request signing is needed.
+    resp = page.context.request.get(f"{vite_url}/api/kalshi/markets?limit=100&status=open")
+    assert resp.ok, f"Markets request failed: {resp.status}"
+    markets = resp.json().get("markets")
+    assert isinstance(markets, list), "Markets response has no 'markets' list"
+    logging.info(f"API returned {len(markets)} open markets.")
+    for market in markets:
+        assert isinstance(market.get("ticker"), str) and market["ticker"], f"Market without ticker: {market}"
+        for field in ("yes_bid", "yes_ask"):
+            assert isinstance(market.get(field), (int, float)), f"{market['ticker']} has non-numeric {field}"
+
+    # The scanner itself only needs to have rendered without an error
+    if page.locator("tr.hover\\:bg-slate-50").count() == 0:
         logging.warning("No markets found. This might be due to sport selection or off-season.")
         # We don't fail, as this is valid behavior if no games are on.
         # But we should verify we didn't get an error toast.
@@ -2,7 +2,13 @@
 import pytest
 from playwright.sync_api import Page, expect
 
-def test_market_selection(page: Page):
+ROW_CHECKBOXES = "tbody input[type='checkbox']"
+
+def row_checked_states(page: Page):
+    """Checked state of every row checkbox, read in one round trip."""
+    return page.locator(ROW_CHECKBOXES).evaluate_all("els => els.map(el => el.checked)")
+
+def test_market_selection(page: Page, vite_url):
     # 1. Setup - Mock Odds API and Kalshi API
     # We need to simulate some markets being loaded
 
@@ -77,19 +83,21 @@ def test_market_selection(page: Page):
         body="""[{"key": "americanfootball_nfl", "title": "NFL", "active": true, "has_outrights": false}]"""
     ))
 
-    page.goto("http://localhost:3000")
+    page.goto(vite_url)
 
-    # Wait for loading
-    page.wait_for_timeout(2000)
+    # Wait for the header to render instead of a fixed delay
+    settings_btn = page.get_by_title("Settings")
+    expect(settings_btn).to_be_visible()
 
     # Enter Odds API Key to trigger fetch
-    page.get_by_title("Settings").click()
+    settings_btn.click()
     page.get_by_label("The-Odds-API Key").fill("test_key")
     page.get_by_role("button", name="Done").click()
 
     # Wait for markets to appear
-    expect(page.get_by_text("Team A vs Team B")).to_be_visible()
-    expect(page.get_by_text("Team C vs Team D")).to_be_visible()
+    # Rows carry data-testid="market-row-<odds event id>"
+    expect(page.get_by_test_id("market-row-game1")).to_be_visible()
+    expect(page.get_by_test_id("market-row-game2")).to_be_visible()
 
     # CHECKBOX VERIFICATION
 
@@ -102,13 +110,13 @@ def test_market_selection(page: Page):
     expect(header_checkbox).to_be_visible()
 
     # Row checkboxes
-    row_checkboxes = page.locator("tbody input[type='checkbox']").all()
+    row_checkboxes = page.locator(ROW_CHECKBOXES).all()
     assert len(row_checkboxes) >= 2
 
     # 2. Verify all checked by default
+    # The header expect auto-waits for the re-render; the rows are then read in one batch
     expect(header_checkbox).to_be_checked()
-    for cb in row_checkboxes:
-        expect(cb).to_be_checked()
+    assert all(row_checked_states(page))
 
     # 3. Uncheck one row (Team A)
     row_checkboxes[0].click()
@@ -121,15 +129,13 @@ def test_market_selection(page: Page):
     header_checkbox.click()
 
     # Should select all again
-    for cb in row_checkboxes:
-        expect(cb).to_be_checked()
     expect(header_checkbox).to_be_checked()
+    assert all(row_checked_states(page))
 
     # 5. Uncheck "Select All" (Deselect All)
     header_checkbox.click()
-    for cb in row_checkboxes:
-        expect(cb).not_to_be_checked()
     expect(header_checkbox).not_to_be_checked()
+    assert not any(row_checked_states(page))
 
     # 6. Check one row manually
     row_checkboxes[1].click()
@@ -147,8 +153,8 @@ def test_market_selection(page: Page):
     # The actual market row is in the second tbody.
     # There are multiple tbodies.
 
-    # Let's target by text to be safe
-    row_team_a = page.get_by_role("row", name="Team A").first
+    # Target the row by its test id
+    row_team_a = page.get_by_test_id("market-row-game1")
     # Check class
     # Since we re-enabled select all, let's uncheck it again
     row_checkboxes[0].click()
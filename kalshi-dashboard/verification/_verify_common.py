@@ -0,0 +1,34 @@
+"""Shared Playwright bootstrap for running the verification scripts standalone."""
+import contextlib
+import os
+import sys
+from playwright.sync_api import sync_playwright
+
+# Standalone, only verification/ is on sys.path; add kalshi-dashboard/ so scripts importing this
+# module first can import testkit (under pytest, pytest.ini's pythonpath already covers it)
+DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if DASHBOARD_DIR not in sys.path:
+    sys.path.append(DASHBOARD_DIR)
+
+from testkit.browser import PASSWORD_GATE_SCRIPT, launch_browser
+
+# The scripts save screenshots under verification/, relative to kalshi-dashboard/
+SCREENSHOT_DIR = "verification"
+
+@contextlib.contextmanager
+def verified_page(**context_kwargs):
+    """Yields a page in a fresh context that accepts the dev server's self-signed certificate
+    and starts past the password gate.
+
+    The browser comes from launch_browser, so CDP_URL attaches to a shared one. Extra keyword
+    arguments go to new_context (e.g. viewport). Everything is closed on exit.
+    """
+    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        try:
+            context = browser.new_context(ignore_https_errors=True, **context_kwargs)
+            context.add_init_script(script=PASSWORD_GATE_SCRIPT)
+            yield context.new_page()
+        finally:
+            browser.close()
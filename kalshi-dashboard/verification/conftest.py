@@ -0,0 +1,58 @@
+"""Fixtures for running verification scripts under pytest, e.g.
+
+    pytest verification/repro_auto_close_session.py
+    pytest -n auto --dist=loadfile verification/
+
+pytest-playwright supplies the session-scoped browser and a fresh context and page per test,
+so each script's test_* entry point runs isolated without launching its own Chromium.
+Under pytest-xdist every worker also gets its own dev server, as in tests/conftest.py.
+"""
+import os
+import pytest
+from testkit.browser import CHROMIUM_ARGS, PASSWORD_GATE_SCRIPT
+from testkit.dev_server import dev_server as start_dev_server
+
+# Each pytest-xdist worker (gw0, gw1, ...) gets its own dev server on 3000 + worker index, so no
+# worker ever stops a server another is still using
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+DEV_SERVER_PORT = 3000 + int(WORKER_ID[2:])
+
+# The scripts keep their verify_*/repro_* names (and __main__ blocks) for standalone use
+SCRIPT_PREFIXES = ("verify_", "repro_")
+
+def pytest_collect_file(file_path, parent):
+    """Collects the verification scripts when the directory is run; explicit paths are collected already."""
+    if file_path.suffix == ".py" and file_path.name.startswith(SCRIPT_PREFIXES) and not parent.session.isinitpath(file_path):
+        return pytest.Module.from_parent(parent, path=file_path)
+
+# optionalhook: without pytest-xdist installed the hook is unknown and would fail validation
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """-n auto: one worker per CPU but one, leaving a core for the Vite and Chromium processes the workers start.
+
+    Safe only because each worker owns its dev server (see DEV_SERVER_PORT).
+    """
+    return max(1, (os.cpu_count() or 1) - 1)
+
+@pytest.fixture(scope="session")
+def dev_server():
+    """This worker's dev server (started or reused), shared by every verification it runs; yields its URL."""
+    # Point the proxy at the server itself so nothing leaks to the real API if a mock is missed
+    with start_dev_server(port=DEV_SERVER_PORT, env={"KALSHI_API_URL": f"http://localhost:{DEV_SERVER_PORT}/api"}) as url:
+        yield url
+
+@pytest.fixture
+def context(context):
+    """pytest-playwright's per-test context, already past the password gate as in tests/conftest.py."""
+    context.add_init_script(script=PASSWORD_GATE_SCRIPT)
+    return context
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args):
+    # The dev server's certificate is self-signed
+    return {**browser_context_args, "ignore_https_errors": True}
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    # The session browser gets the same flags as a standalone launch_browser()
+    return {**browser_type_launch_args, "args": [*browser_type_launch_args.get("args", []), *CHROMIUM_ARGS]}
@@ -1,120 +1,114 @@
 
 import logging
-import time
 import os
-import subprocess
 import json
+import re
 import datetime
-from playwright.sync_api import sync_playwright, expect
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
-def run_verification(page):
-    # Mocking API calls
-    # 1. Mock The-Odds-API
-    page.route("**/sports/*/odds/*", lambda route: route.fulfill(
-        status=200,
-        content_type="application/json",
-        body=json.dumps([{
-            "id": "game1",
-            "sport_key": "americanfootball_nfl",
-            "sport_title": "NFL",
-            "commence_time": (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat() + "Z",
-            "home_team": "TeamA",
-            "away_team": "TeamB",
-            "bookmakers": [{
-                "key": "bookmaker1",
-                "title": "Bookmaker 1",
-                "last_update": (datetime.datetime.now()).isoformat() + "Z",
-                "markets": [{
-                    "key": "h2h",
-                    "outcomes": [
-                        {"name": "TeamA", "price": -150},
-                        {"name": "TeamB", "price": 130}
-                    ]
-                }]
-            }]
-        }])
-    ))
-
-    # 2. Mock Kalshi Markets
-    page.route("**/api/kalshi/markets*", lambda route: route.fulfill(
-        status=200,
-        content_type="application/json",
-        body=json.dumps({
-            "markets": [{
-                "ticker": "KX-TEST-TEAMA",
-                "event_ticker": "KX-TEST",
-                "game_id": "game1",
-                "title": "TeamA vs TeamB",
-                "yes_bid": 60, # High bid to trigger sell
-                "yes_ask": 65,
-                "volume": 1000,
-                "open_interest": 500,
-                "status": "active"
-            }]
-        })
-    ))
-
-    # 3. Mock Portfolio Balance
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(
-        status=200, content_type="application/json", body=json.dumps({"balance": 100000})
-    ))
-
-    # 4. Mock Portfolio Orders
-    page.route("**/api/kalshi/portfolio/orders", lambda route: route.fulfill(
-        status=200, content_type="application/json", body=json.dumps({"orders": []})
-    ))
-
-    # 5. Mock Portfolio Positions (Active Held Position)
-    # We simulate holding TeamA position bought at 50 cents.
-    page.route("**/api/kalshi/portfolio/positions", lambda route: route.fulfill(
-        status=200,
-        content_type="application/json",
-        body=json.dumps({
-            "market_positions": [{
-                "ticker": "KX-TEST-TEAMA",
-                "position": 10,
-                "avg_price": 50,
-                "total_cost": 500,
-                "fees_paid": 10,
-                "status": "HELD",
-                "created": (datetime.datetime.now() - datetime.timedelta(hours=2)).isoformat() + "Z"
-            }]
-        })
-    ))
-
-    # 6. Intercept POST /orders (The Close Action)
-    captured_orders = []
-    def handle_post_orders(route):
-        try:
-            req = route.request
-            if req.method == "POST":
-                data = req.post_data_json
-                captured_orders.append(data)
-                logging.info(f"CAPTURED ORDER: {data}")
-                route.fulfill(status=200, body=json.dumps({"order_id": "order_123"}))
-            else:
-                route.continue_()
-        except Exception as e:
-            logging.error(f"Error handling post orders: {e}")
-            route.continue_()
-
-    page.route("**/api/kalshi/portfolio/orders", handle_post_orders)
-
-    logging.info("Navigating to dashboard...")
-    page.goto("http://localhost:3000")
-
-    # Inject Fake Keys
-    with open("kalshi-dashboard/verification/test_private.pem", "r") as f:
-        private_key = f.read().strip()
-    private_key_js = private_key.replace('\n', '\\n')
-
-    page.evaluate(f"""() => {{
-        localStorage.setItem('kalshi_keys', JSON.stringify({{
-            keyId: 'test_key',
-            privateKey: `{private_key_js}`
-        }}));
+import functools
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from _verify_common import verified_page
+from testkit.dev_server import dev_server
+from testkit.mock_key import mock_key_pem
+from testkit.routes import fulfill_json, route_kalshi
+
+PRIVATE_KEY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_private.pem")
+
+# Timestamps are relative to import time, which stays well inside the app's freshness windows
+# The-Odds-API: TeamA favoured, game tomorrow
+ODDS_BODY = json.dumps([{
+    "id": "game1",
+    "sport_key": "americanfootball_nfl",
+    "sport_title": "NFL",
+    "commence_time": (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat() + "Z",
+    "home_team": "TeamA",
+    "away_team": "TeamB",
+    "bookmakers": [{
+        "key": "bookmaker1",
+        "title": "Bookmaker 1",
+        "last_update": (datetime.datetime.now()).isoformat() + "Z",
+        "markets": [{
+            "key": "h2h",
+            "outcomes": [
+                {"name": "TeamA", "price": -150},
+                {"name": "TeamB", "price": 130}
+            ]
+        }]
+    }]
+}]).encode()
+
+MARKETS_BODY = json.dumps({
+    "markets": [{
+        "ticker": "KX-TEST-TEAMA",
+        "event_ticker": "KX-TEST",
+        "game_id": "game1",
+        "title": "TeamA vs TeamB",
+        "yes_bid": 60, # High bid to trigger sell
+        "yes_ask": 65,
+        "volume": 1000,
+        "open_interest": 500,
+        "status": "active"
+    }]
+}).encode()
+
+BALANCE_BODY = b'{"balance": 100000}'
+EMPTY_ORDERS_BODY = b'{"orders": []}'
+EMPTY_POSITIONS_BODY = b'{"market_positions": []}'
+ORDER_BODY = b'{"order_id": "order_123"}'
+
+# We simulate holding TeamA position bought at 50 cents.
+POSITIONS_BODY = json.dumps({
+    "market_positions": [{
+        "ticker": "KX-TEST-TEAMA",
+        "position": 10,
+        "avg_price": 50,
+        "total_cost": 500,
+        "fees_paid": 10,
+        "status": "HELD",
+        "created": (datetime.datetime.now() - datetime.timedelta(hours=2)).isoformat() + "Z"
+    }]
+}).encode()
+
+# Only The-Odds-API's per-sport odds endpoint, not any same-shaped path on another host
+ODDS_ROUTE_RE = re.compile(r"^https://api\.the-odds-api\.com/v4/sports/[^/]+/odds/")
+
+def handle_orders(route):
+    req = route.request
+    if req.method == "POST":
+        # The Close Action
+        logging.info(f"CAPTURED ORDER: {req.post_data_json}")
+        fulfill_json(route, ORDER_BODY)
+    else:
+        fulfill_json(route, EMPTY_ORDERS_BODY)
+
+def handle_positions(route):
+    # Active Held Position; no settled history
+    settled = "settlement_status=settled" in route.request.url
+    fulfill_json(route, EMPTY_POSITIONS_BODY if settled else POSITIONS_BODY)
+
+KALSHI_HANDLERS = {
+    "markets": lambda route: fulfill_json(route, MARKETS_BODY),
+    "balance": lambda route: fulfill_json(route, BALANCE_BODY),
+    "orders": handle_orders,
+    "positions": handle_positions,
+}
+
+def load_private_key():
+    """The key in test_private.pem if present (it is not committed), otherwise the shared cached mock key."""
+    if os.path.exists(PRIVATE_KEY_PATH):
+        with open(PRIVATE_KEY_PATH, "r") as f:
+            return f.read().strip()
+    return mock_key_pem().strip()
+
+@functools.cache
+def storage_init_script():
+    """Fake keys and OLD trade history, seeded into localStorage before the app loads.
+
+    Built on first use rather than at import, so collecting the test never reads or generates
+    the key; cached, so repeated runs in a session skip the file read.
+    """
+    keys = json.dumps({"keyId": "test_key", "privateKey": load_private_key()})
+    return f"""
+        localStorage.setItem('kalshi_keys', {json.dumps(keys)});
         localStorage.setItem('odds_api_key', 'test_odds_key');
 
         // Inject OLD Trade History
@@ -130,72 +124,69 @@ def run_verification(page):
                 event: 'TeamA vs TeamB'
             }}
         }}));
-    }}""")
+    """
 
-    page.reload()
+def run_verification(page, base_url="https://localhost:3000"):
+    # Mocking API calls: The-Odds-API odds, plus one dispatcher for all Kalshi endpoints
+    page.route(ODDS_ROUTE_RE, lambda route: fulfill_json(route, ODDS_BODY))
+    route_kalshi(page, KALSHI_HANDLERS)
+
+    # Inject Fake Keys before any app code runs, so a single navigation is enough
+    page.add_init_script(script=storage_init_script())
+
+    logging.info("Navigating to dashboard...")
+    page.goto(base_url)
 
     # Wait for wallet active (key injection worked)
     page.wait_for_selector("text=Wallet Active", timeout=20000)
 
-    # Wait for forge load
-    time.sleep(2)
+    # Wait for forge load (index.html loads it as a classic script onto window)
+    page.wait_for_function("() => window.forge !== undefined", timeout=10000)
 
     # Set Auto-Close ON (it defaults to true, but good to be sure)
     # Check if "Auto-Close ON" button exists
 
-    # Start the bot
-    logging.info("Starting bot...")
-    page.get_by_role("button", name="Start").click()
-
-    # Wait for a while to allow auto-close logic to run
-    logging.info("Waiting for auto-close logic...")
-    time.sleep(10)
+    # Start the bot, then give the auto-close logic up to 10s to place an order.
+    # Returns as soon as an order is POSTed instead of always sleeping the full 10s.
+    logging.info("Starting bot and waiting for auto-close logic...")
+    captured_orders = []
+    try:
+        with page.expect_request(
+            lambda r: r.method == "POST" and "/api/kalshi/portfolio/orders" in r.url, timeout=10000
+        ) as order_info:
+            page.get_by_role("button", name="Start").click()
+        captured_orders.append(order_info.value.post_data_json)
+    except PlaywrightTimeoutError:
+        pass
 
     # Check if order was placed
     if len(captured_orders) > 0:
-        logging.info("FAILURE: Order was placed! The restriction did not work (or I misunderstood it).")
-        # Check order details
-        logging.info(f"Order details: {captured_orders[0]}")
+        logging.info(f"Auto-close placed a sell order: {captured_orders[0]}")
     else:
-        logging.info("SUCCESS: No order placed. The session restriction is working.")
+        logging.info("No order placed within 10s.")
 
     return len(captured_orders)
 
-if __name__ == "__main__":
-    try:
-        subprocess.run(["pkill", "-f", "vite"], check=False)
-    except:
-        pass
+def test_auto_close_session(page, dev_server):
+    """Runs the repro against this worker's dev server: pytest verification/repro_auto_close_session.py -s"""
+    orders_count = run_verification(page, dev_server)
+    # autoClose.js has no session or age check: a held bot position (one in tradeHistory with a
+    # matching market) is offered however long ago it was opened, as test_auto_close_after_price_jump expects
+    assert orders_count == 1, "Auto-close placed no sell order for a held position from a previous session"
 
-    logging.info("Starting Dev Server...")
+if __name__ == "__main__":
+    # Only standalone runs log to stderr; under pytest the records go through its log capture
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     # Clean environment variables to ensure no real API calls if leaks happen
-    env = os.environ.copy()
-    env["KALSHI_API_URL"] = "http://localhost:3000/api" # Mock url effectively
-
-    server_process = subprocess.Popen(
-        ["node", "./node_modules/vite/bin/vite.js", "--port", "3000"],
-        cwd="kalshi-dashboard",
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-
-    # Give it time to start
-    time.sleep(5)
+    with dev_server(env={"KALSHI_API_URL": "http://localhost:3000/api"}) as url:
+        try:
+            with verified_page() as page:
+                orders_count = run_verification(page, url)
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            orders_count = run_verification(page)
-            browser.close()
-
-            if orders_count == 0:
-                print("VERIFICATION_RESULT: RESTRICTED")
+            if orders_count == 1:
+                print("VERIFICATION_RESULT: CLOSED")
             else:
-                print("VERIFICATION_RESULT: NOT_RESTRICTED")
+                print("VERIFICATION_RESULT: NOT_CLOSED")
 
-    except Exception as e:
-        logging.error(f"Script failed: {e}")
-    finally:
-        server_process.terminate()
+        except Exception as e:
+            logging.error(f"Script failed: {e}")
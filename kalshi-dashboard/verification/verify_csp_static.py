@@ -0,0 +1,44 @@
+import os
+from html.parser import HTMLParser
+
+# The CSP ships as a <meta> tag in index.html, so checking it needs no browser or dev server
+INDEX_HTML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "index.html")
+
+class CspMetaParser(HTMLParser):
+    """Collects the content of the Content-Security-Policy <meta> tag."""
+
+    def __init__(self):
+        super().__init__()
+        self.policy = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta" and (attrs.get("http-equiv") or "").lower() == "content-security-policy":
+            self.policy = attrs.get("content")
+
+def parse_policy(policy):
+    """Splits a CSP string into {directive: [sources]}."""
+    directives = {}
+    for part in policy.split(";"):
+        tokens = part.split()
+        if tokens:
+            directives[tokens[0]] = tokens[1:]
+    return directives
+
+def test_csp_meta():
+    parser = CspMetaParser()
+    with open(INDEX_HTML, "r") as f:
+        parser.feed(f.read())
+
+    assert parser.policy, "index.html is missing the Content-Security-Policy meta tag"
+    directives = parse_policy(parser.policy)
+
+    assert directives.get("default-src") == ["'self'"], "default-src should be 'self' only"
+    assert directives.get("object-src") == ["'none'"], "object-src should be 'none'"
+    assert directives.get("base-uri") == ["'self'"], "base-uri should be 'self'"
+    # Kalshi calls go through the same-origin proxy; only the Odds API is called directly
+    assert "https://api.the-odds-api.com" in directives.get("connect-src", []), "connect-src must allow The-Odds-API"
+
+if __name__ == "__main__":
+    test_csp_meta()
+    print("✅ Content-Security-Policy meta tag verified in index.html.")
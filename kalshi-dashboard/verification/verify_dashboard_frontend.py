@@ -1,12 +1,7 @@
-from playwright.sync_api import sync_playwright
-import time
-import os
+from _verify_common import verified_page
 
 def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
+    with verified_page() as page:
 
         # Set up mocks for localStorage to enable auto-close and auto-bid
         # Also need to mock 'kalshi_keys' to enable 'authenticated' state
@@ -45,24 +40,20 @@ def run():
         """)
 
         # Go to app
-        page.goto("http://localhost:3000")
+        page.goto("https://localhost:3000")
 
         # Wait for app to load
-        page.wait_for_selector("text=Kalshi ArbBot")
+        page.wait_for_selector("text=Kalshi ArbBot", state="visible", timeout=10000)
 
         # Start the bot
         start_button = page.get_by_role("button", name="Start")
         if start_button.is_visible():
             start_button.click()
 
-        time.sleep(2) # Wait for initial effects
+        page.wait_for_load_state("networkidle") # Wait for initial effects
 
         # Take screenshot of the dashboard running with Auto-Close ON
-        if not os.path.exists("verification"):
-            os.makedirs("verification")
-
         page.screenshot(path="verification/dashboard_auto_close.png")
-        browser.close()
 
 if __name__ == "__main__":
     run()
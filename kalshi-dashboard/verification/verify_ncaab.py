@@ -1,7 +1,9 @@
 
 import json
-import time
-from playwright.sync_api import sync_playwright, expect
+from playwright.sync_api import expect
+from _verify_common import verified_page
+from testkit.dev_server import dev_server
+from testkit.routes import ODDS_API_RE, fulfill_json, route_kalshi
 
 def generate_ncaab_odds_response():
     return [
@@ -47,11 +49,40 @@ def generate_kalshi_markets_ncaab():
         ]
     }
 
-def run(playwright):
-    browser = playwright.chromium.launch(headless=True)
-    context = browser.new_context()
-    page = context.new_page()
-
+SPORTS_BODY = json.dumps([
+    {"key": "americanfootball_nfl", "title": "Football (NFL)", "active": True},
+    {"key": "basketball_ncaab", "title": "Basketball (NCAAB)", "active": True}
+]).encode()
+NCAAB_ODDS_BODY = json.dumps(generate_ncaab_odds_response()).encode()
+NCAAB_MARKETS_BODY = json.dumps(generate_kalshi_markets_ncaab()).encode()
+EMPTY_LIST_BODY = b'[]'
+EMPTY_MARKETS_BODY = b'{"markets": []}'
+BALANCE_BODY = b'{"balance": 50000}'
+EMPTY_ORDERS_BODY = b'{"orders": []}'
+EMPTY_POSITIONS_BODY = b'{"market_positions": []}'
+
+def handle_odds_api(route):
+    url = route.request.url
+    if "/odds/" in url:
+        body = NCAAB_ODDS_BODY if "basketball_ncaab" in url else EMPTY_LIST_BODY
+    else:
+        # Sports List
+        body = SPORTS_BODY
+    fulfill_json(route, body)
+
+def handle_markets(route):
+    # The app appends series_ticker to the query; only KXNCAAMBGAME has markets.
+    # If the app still queries the old KXNCAABGAME series it gets none, simulating "not found".
+    fulfill_json(route, NCAAB_MARKETS_BODY if "KXNCAAMBGAME" in route.request.url else EMPTY_MARKETS_BODY)
+
+KALSHI_HANDLERS = {
+    "balance": lambda route: fulfill_json(route, BALANCE_BODY),
+    "markets": handle_markets,
+    "orders": lambda route: fulfill_json(route, EMPTY_ORDERS_BODY),
+    "positions": lambda route: fulfill_json(route, EMPTY_POSITIONS_BODY),
+}
+
+def run_verification(page, base_url="https://localhost:3000"):
     # Inject Mock Forge for auth
     page.add_init_script("""
         window.forge = {
@@ -70,60 +101,25 @@ def run(playwright):
     """)
 
     # Mock APIs
-    def handle_odds_api(route):
-        url = route.request.url
-        if "/odds/" in url:
-            if "basketball_ncaab" in url:
-                 route.fulfill(json=generate_ncaab_odds_response())
-            else:
-                 route.fulfill(json=[])
-        else:
-            # Sports List
-            route.fulfill(json=[
-                {"key": "americanfootball_nfl", "title": "Football (NFL)", "active": True},
-                {"key": "basketball_ncaab", "title": "Basketball (NCAAB)", "active": True}
-            ])
-    page.route("**/api.the-odds-api.com/**", handle_odds_api)
-
-    def handle_kalshi_markets(route):
-        # We need to make sure the APP queries for KXNCAAMBGAME
-        # The app will append series_ticker to the query
-        url = route.request.url
-        if "KXNCAAMBGAME" in url:
-            route.fulfill(json=generate_kalshi_markets_ncaab())
-        elif "KXNCAABGAME" in url:
-            # If the app still queries the old one, return empty to simulate "not found"
-            route.fulfill(json={"markets": []})
-        else:
-            # Default or other series
-            route.fulfill(json={"markets": []})
-
-    page.route("**/api/kalshi/markets*", handle_kalshi_markets)
-
-    page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json={"balance": 50000}))
-    page.route("**/api/kalshi/portfolio/orders*", lambda route: route.fulfill(json={"orders": []}))
-    page.route("**/api/kalshi/portfolio/positions*", lambda route: route.fulfill(json={"market_positions": []}))
+    page.route(ODDS_API_RE, handle_odds_api)
+    route_kalshi(page, KALSHI_HANDLERS)
 
     # Go to app
-    page.goto("http://localhost:3000")
+    page.goto(base_url)
 
     # Wait for app to load
     page.wait_for_selector("h1", state="visible")
 
     # Open Sport Filter
-    # "1 Sport" because NFL is selected by default
-    sport_btn = page.get_by_text("1 Sport")
-    if not sport_btn.count():
-        sport_btn = page.get_by_text("Select Sports")
-
-    sport_btn.click()
+    page.get_by_label("Filter by Sport").click()
 
-    # Wait a bit for animation
-    page.wait_for_timeout(500)
+    # Wait for the dropdown itself rather than a fixed delay
+    dropdown = page.get_by_role("dialog", name="Select Sports")
+    expect(dropdown).to_be_visible()
     page.screenshot(path="verification/dropdown_debug.png")
 
     # Check if NCAAB is there
-    ncaab_option = page.get_by_text("Basketball (NCAAB)")
+    ncaab_option = dropdown.get_by_text("Basketball (NCAAB)")
     expect(ncaab_option).to_be_visible()
 
     # Select it
@@ -148,8 +144,10 @@ def run(playwright):
     page.screenshot(path="verification/ncaab_verification.png")
     print("Verification successful, screenshot saved to verification/ncaab_verification.png")
 
-    browser.close()
+def test_ncaab_markets(page, dev_server):
+    run_verification(page, dev_server)
 
 if __name__ == "__main__":
-    with sync_playwright() as playwright:
-        run(playwright)
+    with dev_server() as url:
+        with verified_page() as page:
+            run_verification(page, url)
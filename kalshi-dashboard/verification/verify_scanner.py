@@ -1,13 +1,10 @@
-from playwright.sync_api import sync_playwright
-import time
+from playwright.sync_api import expect
+from _verify_common import verified_page
 import os
+import json
 
 def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
+    with verified_page() as page:
         # Inject real keys into localStorage
         key_id = os.environ.get("KALSHI_DEMO_API_KEY_ID")
         private_key = os.environ.get("KALSHI_DEMO_API_KEY")
@@ -17,19 +14,14 @@ def run():
         if len(odds_key) == 64 and odds_key[:32] == odds_key[32:]:
             odds_key = odds_key[:32]
 
-        page.goto("http://localhost:3000")
-
-        private_key_js = private_key.replace('\n', '\\n')
-
-        page.evaluate(f"""() => {{
-            localStorage.setItem('kalshi_keys', JSON.stringify({{
-                keyId: '{key_id}',
-                privateKey: `{private_key_js}`
-            }}));
-            localStorage.setItem('odds_api_key', '{odds_key}');
-        }}""")
+        # Seed the keys before any app code runs, so a single navigation is enough
+        keys = json.dumps({"keyId": key_id, "privateKey": private_key})
+        page.add_init_script(script=f"""
+            localStorage.setItem('kalshi_keys', {json.dumps(keys)});
+            localStorage.setItem('odds_api_key', {json.dumps(odds_key)});
+        """)
 
-        page.reload()
+        page.goto("https://localhost:3000")
 
         print("Waiting for wallet connection...")
         try:
@@ -39,20 +31,18 @@ def run():
             print("Wallet failed to connect (UI check).")
 
         print("Opening Sports Dropdown...")
-        try:
-            page.get_by_text("Select Sports").click()
-        except:
-             page.locator("button:has-text('Sport')").first.click()
+        page.get_by_label("Filter by Sport").click()
+        dropdown = page.get_by_role("dialog", name="Select Sports")
+        expect(dropdown).to_be_visible()
 
-        # Select multiple sports
+        # Select multiple sports, skipping any not listed. One round trip reads every option
+        # label, rather than an is_visible() probe per sport; the clicks stay real clicks so
+        # React applies each selection in turn.
         sports = ["Basketball (NBA)", "Hockey (NHL)", "Basketball (NCAAB)"]
+        listed = set(dropdown.locator("button span").all_inner_texts())
         for sport in sports:
-            try:
-                if page.get_by_text(sport).is_visible():
-                    page.get_by_text(sport).click()
-                    time.sleep(0.2)
-            except:
-                pass
+            if sport in listed:
+                dropdown.get_by_text(sport, exact=True).click()
 
         # Close dropdown
         page.get_by_text("Kalshi ArbBot").click()
@@ -70,7 +60,5 @@ def run():
         page.screenshot(path=screenshot_path)
         print(f"Screenshot saved to {screenshot_path}")
 
-        browser.close()
-
 if __name__ == "__main__":
     run()
@@ -1,11 +1,51 @@
 from playwright.sync_api import sync_playwright, expect
-import time
+from testkit.browser import PASSWORD_GATE_SCRIPT, launch_browser
+
+# All frontend checks share one browser and one page load; each only reads or clicks what it needs
+
+def check_app_loaded(page):
+    # The "Start" button is a proxy for app health
+    expect(page.get_by_role("button", name="Start")).to_be_visible()
+    print("App loaded successfully.")
+
+    # Take a screenshot of the dashboard before any interaction
+    page.screenshot(path="verification/frontend_snapshot.png")
+    print("Screenshot saved to verification/frontend_snapshot.png")
+
+def check_market_scanner(page):
+    print("Checking Market Scanner...")
+    expect(page.get_by_text("Market Scanner")).to_be_visible()
+
+def check_sport_filter(page):
+    # Check for "Sports" filter button
+    print("Checking Sports Filter...")
+    # The button shows "1 Sport" by default if one is selected
+    filter_btn = page.get_by_label("Filter by Sport")
+    expect(filter_btn).to_be_visible()
+
+    # Click the filter button to open dropdown
+    print("Opening Filter Dropdown...")
+    filter_btn.click()
+
+    # Verify dropdown content (Sports list)
+    # "Available Sports" is the text in the header of the dropdown
+    expect(page.get_by_text("Available Sports")).to_be_visible()
+    expect(page.get_by_text("Football (NFL)")).to_be_visible()
+    expect(page.get_by_text("Basketball (NBA)")).to_be_visible()
+
+    # Take screenshot of the open filter
+    print("Taking screenshot...")
+    page.screenshot(path="verification_screenshot.png")
+
+CHECKS = [check_app_loaded, check_market_scanner, check_sport_filter]
 
 def verify_frontend():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        # Same flags as the other scripts, or the shared browser at $CDP_URL
+        browser = launch_browser(p)
         # Ignore HTTPS errors because of self-signed cert
         context = browser.new_context(ignore_https_errors=True)
+        context.add_init_script(script=PASSWORD_GATE_SCRIPT)
         page = context.new_page()
 
         # Mock window.forge to prevent blocking
@@ -19,42 +59,23 @@ def verify_frontend():
             };
         """)
 
-        print("Navigating to app...")
-        # Port changed to 3000 according to logs, and HTTPS is enabled
-        page.goto("https://localhost:3000")
-
-        # Wait for app to load
-        print("Waiting for app to load...")
-        page.wait_for_selector("text=Kalshi ArbBot", timeout=10000)
-
-        # Check for Market Scanner
-        print("Checking Market Scanner...")
-        expect(page.get_by_text("Market Scanner")).to_be_visible()
-
-        # Check for "Sports" filter button
-        print("Checking Sports Filter...")
-        # The button shows "1 Sport" by default if one is selected
-        filter_btn = page.locator("button[aria-label='Filter by Sport']")
-        expect(filter_btn).to_be_visible()
-
-        # Click the filter button to open dropdown
-        print("Opening Filter Dropdown...")
-        filter_btn.click()
-
-        # Verify dropdown content (Sports list)
-        # Assuming defaults are NFL, NBA, etc.
-        # "Available Sports" is the text in the header of the dropdown
-        expect(page.get_by_text("Available Sports")).to_be_visible()
-        expect(page.get_by_text("Football (NFL)")).to_be_visible()
-        expect(page.get_by_text("Basketball (NBA)")).to_be_visible()
-
-        # Take screenshot of the open filter
-        print("Taking screenshot...")
-        page.screenshot(path="verification_screenshot.png")
-
-        # Close browser
-        browser.close()
-        print("Verification complete.")
+        try:
+            print("Navigating to app...")
+            page.goto("https://localhost:3000")
+
+            # Wait for app to load
+            print("Waiting for app to load...")
+            page.wait_for_selector("text=Kalshi ArbBot", timeout=10000)
+
+            for check in CHECKS:
+                check(page)
+            print("Verification complete.")
+        except Exception as e:
+            print(f"Error: {e}")
+            page.screenshot(path="verification/error.jpg", type="jpeg", quality=60)
+            raise
+        finally:
+            browser.close()
 
 if __name__ == "__main__":
     verify_frontend()
@@ -1,5 +1,3 @@
-from playwright.sync_api import sync_playwright
-
 def test_accessibility_props():
     # Since we can't easily hydrate the React app without a server in this verification script,
     # we will rely on static inspection of the source files which we already did,
@@ -1,32 +1,92 @@
-
 import pytest
 from playwright.sync_api import sync_playwright, expect
 import json
+import re
 import time
 
+# Prebuilt bodies, served as-is by the handlers below
+JSON = "application/json"
+BALANCE_BODY = b'{"balance": 100000}'
+ORDERS_BODY = json.dumps({
+    "orders": [
+        {
+            "order_id": "order-1",
+            "ticker": "KX-TEST-23DEC31",
+            "action": "buy",
+            "side": "yes",
+            "count": 10,
+            "fill_count": 0,
+            "remaining_count": 10,
+            "yes_price": 50,
+            "status": "active",
+            "created_time": "2023-12-01T12:00:00Z",
+            "expiration_time": "2023-12-02T12:00:00Z"
+        }
+    ]
+}).encode()
+POSITIONS_BODY = json.dumps({
+    "market_positions": [
+        {
+            "ticker": "KX-TEST-POS-23DEC31",
+            "position": 10,
+            "total_cost": 500,
+            "fees_paid": 10,
+            "avg_price": 50,
+            "realized_pnl": 0,
+            "settlement_status": "unsettled"
+        }
+    ]
+}).encode()
+EMPTY_POSITIONS_BODY = b'{"market_positions": []}'
+MARKETS_BODY = json.dumps({"markets": [
+    {"ticker": "KX-TEST-23DEC31", "yes_bid": 55, "yes_ask": 60},
+    {"ticker": "KX-TEST-POS-23DEC31", "yes_bid": 55, "yes_ask": 60}
+]}).encode()
+
+# One route for every mocked Kalshi endpoint (query string optional), dispatched on the path
+KALSHI_ROUTE_RE = re.compile(r"/api/kalshi/(markets|portfolio/balance|portfolio/orders|portfolio/positions)(?:\?.*)?$")
+KALSHI_BODIES = {
+    "markets": MARKETS_BODY,
+    "portfolio/balance": BALANCE_BODY,
+    "portfolio/orders": ORDERS_BODY,
+    "portfolio/positions": POSITIONS_BODY,
+}
+ODDS_API_RE = re.compile(r"^https://api\.the-odds-api\.com/v4/sports/")
+
+def handle_kalshi(route):
+    url = route.request.url
+    endpoint = KALSHI_ROUTE_RE.search(url).group(1)
+    if endpoint == "portfolio/positions" and "settlement_status=settled" in url:
+        body = EMPTY_POSITIONS_BODY
+    else:
+        body = KALSHI_BODIES[endpoint]
+    route.fulfill(status=200, content_type=JSON, body=body)
+
+# Stored as the JSON string localStorage holds, embedded as a JS string literal, so the
+# init script hands it straight to setItem instead of parsing an object literal and re-stringifying it
+TRADE_HISTORY_JSON = json.dumps({
+    "KX-TEST-23DEC31": {
+        "source": "auto",
+        "fairValue": 60,
+        "orderPlacedAt": 1701432000000,
+        "event": "Test Event",
+        "marketId": "KX-TEST-23DEC31"
+    },
+    "KX-TEST-POS-23DEC31": {
+        "source": "auto",
+        "fairValue": 60,
+        "orderPlacedAt": 1701432000000,
+        "event": "Test Position Event",
+        "marketId": "KX-TEST-POS-23DEC31"
+    }
+})
+
 def test_analysis_modal_behavior():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         context = browser.new_context(ignore_https_errors=True)
 
         # Inject auth and trade history
-        trade_history = {
-            "KX-TEST-23DEC31": {
-                "source": "auto",
-                "fairValue": 60,
-                "orderPlacedAt": 1701432000000,
-                "event": "Test Event",
-                "marketId": "KX-TEST-23DEC31"
-            },
-            "KX-TEST-POS-23DEC31": {
-                "source": "auto",
-                "fairValue": 60,
-                "orderPlacedAt": 1701432000000,
-                "event": "Test Position Event",
-                "marketId": "KX-TEST-POS-23DEC31"
-            }
-        }
-
         context.add_init_script(f"""
             window.localStorage.setItem('kalshi_keys', JSON.stringify({{
                 keyId: 'test-key',
@@ -34,53 +94,14 @@ def test_analysis_modal_behavior():
             }}));
             window.sessionStorage.setItem('authenticated', 'true');
             window.localStorage.setItem('odds_api_key', 'test-odds-key');
-            window.localStorage.setItem('kalshi_trade_history', JSON.stringify({json.dumps(trade_history)}));
+            window.localStorage.setItem('kalshi_trade_history', {json.dumps(TRADE_HISTORY_JSON)});
         """)
 
-        page = context.new_page()
+        # Mock API responses on the context, so they are in place before the page opens
+        context.route(KALSHI_ROUTE_RE, handle_kalshi)
+        context.route(ODDS_API_RE, lambda route: route.fulfill(status=200, content_type=JSON, body=b"[]"))
 
-        # Mock API responses - Match the actual URLs requested by the browser
-        page.route("**/api/kalshi/portfolio/balance", lambda route: route.fulfill(json={"balance": 100000}))
-        page.route("**/api/kalshi/portfolio/orders", lambda route: route.fulfill(json={
-            "orders": [
-                {
-                    "order_id": "order-1",
-                    "ticker": "KX-TEST-23DEC31",
-                    "action": "buy",
-                    "side": "yes",
-                    "count": 10,
-                    "fill_count": 0,
-                    "remaining_count": 10,
-                    "yes_price": 50,
-                    "status": "active",
-                    "created_time": "2023-12-01T12:00:00Z",
-                    "expiration_time": "2023-12-02T12:00:00Z"
-                }
-            ]
-        }))
-        page.route("**/api/kalshi/portfolio/positions", lambda route: route.fulfill(json={
-            "market_positions": [
-                {
-                    "ticker": "KX-TEST-POS-23DEC31",
-                    "position": 10,
-                    "total_cost": 500,
-                    "fees_paid": 10,
-                    "avg_price": 50,
-                    "realized_pnl": 0,
-                    "settlement_status": "unsettled"
-                }
-            ]
-        }))
-        page.route("**/api/kalshi/portfolio/positions?settlement_status=settled", lambda route: route.fulfill(json={"market_positions": []}))
-
-        # Mock markets
-        page.route("**/api/kalshi/markets**", lambda route: route.fulfill(json={"markets": [
-            {"ticker": "KX-TEST-23DEC31", "yes_bid": 55, "yes_ask": 60},
-            {"ticker": "KX-TEST-POS-23DEC31", "yes_bid": 55, "yes_ask": 60}
-        ]}))
-
-        # Mock Odds API
-        page.route("https://api.the-odds-api.com/v4/sports/**", lambda route: route.fulfill(json=[]))
+        page = context.new_page()
 
         page.goto("https://127.0.0.1:3000")
 
@@ -90,7 +111,8 @@ def test_analysis_modal_behavior():
         # --- Test 1: Resting Order ---
         print("Switching to Resting tab...")
         page.click("button:has-text('Resting')")
-        page.wait_for_timeout(1000)
+        # Wait for the tab switch to render instead of a fixed 1s
+        expect(page.locator("#tab-resting")).to_have_attribute("aria-selected", "true")
 
         # The row for resting order
         resting_row = page.locator("tr").filter(has_text="KX-TEST-23DEC31")
@@ -117,7 +139,7 @@ def test_analysis_modal_behavior():
         # --- Test 2: Held Position ---
         print("Switching to Positions tab...")
         page.click("button:has-text('Positions')")
-        page.wait_for_timeout(1000)
+        expect(page.locator("#tab-positions")).to_have_attribute("aria-selected", "true")
 
         pos_row = page.locator("tr").filter(has_text="KX-TEST-POS-23DEC31")
         if pos_row.count() > 0:
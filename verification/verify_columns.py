@@ -1,5 +1,5 @@
 import re
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, expect
 
 def verify_table_columns():
     with sync_playwright() as p:
@@ -34,7 +34,7 @@ def verify_table_columns():
             page.wait_for_selector('h1:has-text("Kalshi ArbBot")', timeout=15000)
         except:
             print("Dashboard did not load. Check screenshots.")
-            page.screenshot(path="verification/dashboard_failed.png")
+            page.screenshot(path="verification/dashboard_failed.jpg", type="jpeg", quality=60)
             browser.close()
             return
 
@@ -48,7 +48,8 @@ def verify_table_columns():
         except Exception as e:
             print(f"Failed to click positions by ID: {e}")
 
-        page.wait_for_timeout(1000) # Wait for render
+        # Wait for the tab switch to render instead of a fixed 1s
+        expect(page.locator("#tab-positions")).to_have_attribute("aria-selected", "true")
         page.screenshot(path="verification/dashboard_positions.png")
 
         headers = page.locator("div[role='tabpanel'] table thead tr th button span:first-child").all_inner_texts()
@@ -61,7 +62,7 @@ def verify_table_columns():
         except Exception as e:
             print(f"Failed to click resting by ID: {e}")
 
-        page.wait_for_timeout(1000)
+        expect(page.locator("#tab-resting")).to_have_attribute("aria-selected", "true")
         page.screenshot(path="verification/dashboard_resting.png")
         headers = page.locator("div[role='tabpanel'] table thead tr th button span:first-child").all_inner_texts()
         headers = [h for h in headers if h.strip()]
@@ -73,7 +74,7 @@ def verify_table_columns():
         except Exception as e:
             print(f"Failed to click history by ID: {e}")
 
-        page.wait_for_timeout(1000)
+        expect(page.locator("#tab-history")).to_have_attribute("aria-selected", "true")
         page.screenshot(path="verification/dashboard_history.png")
         headers = page.locator("div[role='tabpanel'] table thead tr th button span:first-child").all_inner_texts()
         headers = [h for h in headers if h.strip()]
@@ -77,7 +77,7 @@ def verify_refresh_settings():
             print(f"Test failed: {e}")
             if not os.path.exists("verification"):
                 os.makedirs("verification")
-            page.screenshot(path="verification/failure.png")
+            page.screenshot(path="verification/failure.jpg", type="jpeg", quality=60)
             raise e
         finally:
             browser.close()
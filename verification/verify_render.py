@@ -1,44 +0,0 @@
-from playwright.sync_api import sync_playwright
-
-def verify_frontend():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        # Ignore HTTPS errors for localhost with self-signed certs
-        context = browser.new_context(ignore_https_errors=True)
-        page = context.new_page()
-
-        # Navigate to the app (assuming default Vite port)
-        try:
-            page.goto("https://localhost:3000", timeout=10000)
-            page.wait_for_load_state("networkidle")
-        except Exception as e:
-            print(f"Navigation failed: {e}")
-            browser.close()
-            return
-
-        # 1. Verify Cancellation Modal Markup (Hidden but present in DOM)
-        # We can inspect the code presence via React devtools or just trust the previous verify_a11y_props.py
-        # But we can try to force the modal open if we could mock the state.
-        # Since state mocking is hard from outside, we will inspect the DOM for static elements like PortfolioRow
-        # and see if the Aria Label is present on the button.
-
-        # Mock some portfolio data to ensure rows render
-        # We'll inject a script to set the state if possible, or just wait for "No active positions"
-        # The empty state doesn't have the button.
-
-        # Let's inspect the "Start" button which is visible.
-        # It should have title="Managed by Schedule" if scheduled, etc.
-        # But we changed MarketRow and CancellationModal and PortfolioRow.
-
-        # Let's try to verify the "Start" button availability as a proxy for app health.
-        if page.get_by_role("button", name="Start").is_visible():
-            print("App loaded successfully.")
-
-        # Take a screenshot of the dashboard
-        page.screenshot(path="verification/frontend_snapshot.png")
-        print("Screenshot saved to verification/frontend_snapshot.png")
-
-        browser.close()
-
-if __name__ == "__main__":
-    verify_frontend()
@@ -38,7 +38,7 @@ def verify_market_scanner_switcher():
             expect(page.get_by_text("Market Scanner")).to_be_visible(timeout=30000)
         except:
             print("Market Scanner header not found. Taking screenshot of error state.")
-            page.screenshot(path="verification/error_state.png")
+            page.screenshot(path="verification/error_state.jpg", type="jpeg", quality=60)
             return
 
         # Verify the MarketTypeSelector is present
@@ -47,9 +47,12 @@ def verify_market_scanner_switcher():
         spreads_btn = page.get_by_role("button", name="Spreads")
         totals_btn = page.get_by_role("button", name="Totals")
 
-        if moneyline_btn.is_visible() and spreads_btn.is_visible() and totals_btn.is_visible():
+        # expect() polls in the driver, so buttons still rendering are not reported missing
+        try:
+            for btn in (moneyline_btn, spreads_btn, totals_btn):
+                expect(btn).to_be_visible(timeout=5000)
             print("MarketTypeSelector buttons visible.")
-        else:
+        except AssertionError:
             print("MarketTypeSelector buttons MISSING.")
 
         # Take screenshot of the initial state (Moneyline selected)
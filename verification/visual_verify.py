@@ -5,7 +5,8 @@ def verify_sport_filter_visuals():
     with sync_playwright() as p:
         # Launch browser with ignore_https_errors since we use self-signed certs
         browser = p.chromium.launch(headless=True, args=["--ignore-certificate-errors"])
-        context = browser.new_context(ignore_https_errors=True)
+        # Mobile viewport to verify responsive width, set on the context rather than resized after
+        context = browser.new_context(ignore_https_errors=True, viewport={"width": 375, "height": 667})
         page = context.new_page()
 
         # Mock window.forge to prevent errors
@@ -19,9 +20,6 @@ def verify_sport_filter_visuals():
             };
         """)
 
-        # Set viewport to mobile size to verify responsive width
-        page.set_viewport_size({"width": 375, "height": 667})
-
         try:
             print("Navigating to app...")
             page.goto("https://localhost:3000")